@@ -2,19 +2,87 @@
 Pytest configuration and fixtures for e2e tests.
 """
 
+import os
+
 import pytest
 from things3.things3_api import Things3API
 
+# pytest-xdist worker running this session (e.g. "gw0"), empty when serial
+WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+
+# Tag applied to every todo and project created by the e2e tests. Each
+# worker uses its own, so its cleanup never deletes objects that tests on
+# other workers are still using
+E2E_TAG = f"e2e-test-{WORKER}" if WORKER else "e2e-test"
+
+# Deletes the todos and projects tagged with exactly E2E_TAG, then the tag.
+# "tag names contains" is a substring match, so it only narrows the search;
+# each candidate's tag names are split and compared as whole tags, which
+# keeps e.g. "e2e-testing" or another worker's "e2e-test-gw10" untouched
+CLEANUP_SCRIPT = f"""tell application "Things3"
+    set AppleScript's text item delimiters to ", "
+    repeat with candidate in (every to do whose tag names contains "{E2E_TAG}")
+        set tagged to contents of candidate
+        if text items of (tag names of tagged) contains "{E2E_TAG}" then
+            delete tagged
+        end if
+    end repeat
+    repeat with candidate in (every project whose tag names contains "{E2E_TAG}")
+        set tagged to contents of candidate
+        if text items of (tag names of tagged) contains "{E2E_TAG}" then
+            delete tagged
+        end if
+    end repeat
+    if exists tag "{E2E_TAG}" then delete tag "{E2E_TAG}"
+end tell"""
+
 
 @pytest.fixture(scope="session")
 def api():
     """
     Create a Things3API instance for testing.
-    
+
     This fixture has session scope to reuse the same API instance
-    across all tests in the session.
+    across all tests in the session. Things 3 is launched and the
+    AppleScript bridge warmed up once before the first test, and the
+    todos and projects created by the tests are deleted at the end of the session.
+    """
+    _api = Things3API()
+
+    # Pay the Things 3 cold-start cost once, outside of the tests
+    _api.orchestrator.engine.execute('tell application "Things3" to launch')
+    _api.get_all_areas()
+
+    yield _api
+
+    # Delete every todo and project created by this worker's tests in a
+    # single AppleScript run
+    _api.orchestrator.execute_command(CLEANUP_SCRIPT)
+
+
+@pytest.fixture(scope="session")
+def e2e_tag():
+    """
+    Tag to apply to every todo and project a test creates.
+
+    Objects carrying it are deleted when this worker's session ends.
     """
-    return Things3API()
+    return E2E_TAG
+
+
+@pytest.fixture(scope="session")
+def unique_name():
+    """
+    Make names of test-created objects unique per pytest-xdist worker.
+
+    When the suite runs with ``pytest -n auto`` each worker appends its
+    ID (e.g. "gw0") so parallel tests never collide on the same name.
+    """
+
+    def _unique_name(name: str) -> str:
+        return f"{name} [{WORKER}]" if WORKER else name
+
+    return _unique_name
 
 
 @pytest.fixture(scope="function")
@@ -23,4 +91,4 @@ def test_todo_id():
     Placeholder for test todo ID that can be used across test functions.
     This will be set by the create test and used by update test.
     """
-    return None
\ No newline at end of file
+    return None
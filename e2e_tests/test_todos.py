@@ -13,37 +13,43 @@ from things3.things3_api import Things3API
 from things3.models import Todo, Project, Area, TodoCreate, TodoUpdate, ProjectCreate, ProjectUpdate
 
 
+@pytest.mark.slow
 def test_get_all_todos(api: Things3API):
     """Test get_all_todos returns results without errors."""
-    todos = api.get_all_todos()
+    todos = api.get_all_todos(limit=1)
     assert isinstance(todos, list)
+    assert len(todos) <= 1
     print(f"Found {len(todos)} todos")
 
 
+@pytest.mark.slow
 def test_get_all_projects(api: Things3API):
     """Test get_all_projects returns results without errors."""
-    projects = api.get_all_projects()
+    projects = api.get_all_projects(limit=1)
     assert isinstance(projects, list)
+    assert len(projects) <= 1
     print(f"Found {len(projects)} projects")
 
 
+@pytest.mark.slow
 def test_get_all_areas(api: Things3API):
     """Test get_all_areas returns results without errors."""
-    areas = api.get_all_areas()
+    areas = api.get_all_areas(limit=1)
     assert isinstance(areas, list)
+    assert len(areas) <= 1
     print(f"Found {len(areas)} areas")
 
 
-def test_todo_create_and_read(api: Things3API):
+def test_todo_create_and_read(api: Things3API, unique_name, e2e_tag):
     """Test creating a todo and reading it back."""
     # Create a todo
     tomorrow = date.today() + timedelta(days=1)
     
     create_data = TodoCreate(
-        name="E2E Test Todo - Basic",
+        name=unique_name("E2E Test Todo - Basic"),
         notes="This is a test todo created by the e2e test suite.",
         due_date=tomorrow,
-        tags=["e2e-test", "automated"],
+        tags=[e2e_tag, "automated"],
         when="today"
     )
     
@@ -66,13 +72,13 @@ def test_todo_create_and_read(api: Things3API):
     print(f"Successfully read back todo: {read_todo.name}")
 
 
-def test_todo_update_and_read(api: Things3API):
+def test_todo_update_and_read(api: Things3API, unique_name, e2e_tag):
     """Test updating a todo and reading it back."""
     # First create a todo
     create_data = TodoCreate(
-        name="E2E Test Todo - For Update",
+        name=unique_name("E2E Test Todo - For Update"),
         notes="This todo will be updated.",
-        tags=["e2e-test"],
+        tags=[e2e_tag],
         when="anytime"
     )
     
@@ -83,10 +89,10 @@ def test_todo_update_and_read(api: Things3API):
     next_week = date.today() + timedelta(days=7)
     
     update_data = TodoUpdate(
-        name="E2E Test Todo - Updated",
+        name=unique_name("E2E Test Todo - Updated"),
         notes="Updated notes: This todo has been modified by the e2e test suite.",
         due_date=next_week,
-        tags=["e2e-test", "automated", "updated"],
+        tags=[e2e_tag, "automated", "updated"],
         when="anytime"
     )
     
@@ -119,16 +125,16 @@ def test_todo_update_and_read(api: Things3API):
     print(f"  Status: {final_todo.status}")
 
 
-def test_project_create_and_read(api: Things3API):
+def test_project_create_and_read(api: Things3API, unique_name, e2e_tag):
     """Test creating a project and reading it back."""
     # Create a project
     next_week = date.today() + timedelta(days=7)
     
     create_data = ProjectCreate(
-        name="E2E Test Project - Basic",
+        name=unique_name("E2E Test Project - Basic"),
         notes="This is a test project created by the e2e test suite.",
         deadline=next_week,
-        tags=["e2e-test", "automated"],
+        tags=[e2e_tag, "automated"],
         when="today"
     )
     
@@ -151,13 +157,13 @@ def test_project_create_and_read(api: Things3API):
     print(f"Successfully read back project: {read_project.name}")
 
 
-def test_project_update_and_read(api: Things3API):
+def test_project_update_and_read(api: Things3API, unique_name, e2e_tag):
     """Test updating a project and reading it back."""
     # First create a project
     create_data = ProjectCreate(
-        name="E2E Test Project - For Update",
+        name=unique_name("E2E Test Project - For Update"),
         notes="This project will be updated.",
-        tags=["e2e-test"],
+        tags=[e2e_tag],
         when="anytime"
     )
     
@@ -168,10 +174,10 @@ def test_project_update_and_read(api: Things3API):
     two_weeks = date.today() + timedelta(days=14)
     
     update_data = ProjectUpdate(
-        name="E2E Test Project - Updated",
+        name=unique_name("E2E Test Project - Updated"),
         notes="Updated notes: This project has been modified by the e2e test suite.",
         deadline=two_weeks,
-        tags=["e2e-test", "automated", "updated"],
+        tags=[e2e_tag, "automated", "updated"],
         when="today"
     )
     
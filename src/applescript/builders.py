@@ -9,6 +9,9 @@ from typing import Any, Dict, List, Optional, Union
 
 from applescript.converters import PythonToAppleScriptConverter
 
+# Shared by all commands; the converter keeps no state between conversions
+_CONVERTER = PythonToAppleScriptConverter()
+
 
 class AppleScriptCommand:
     """
@@ -18,12 +21,15 @@ class AppleScriptCommand:
     using method chaining.
     """
 
+    __slots__ = ("_tell_app", "_commands", "_converter", "_raw_script", "_run_argv")
+
     def __init__(self):
         """Initialize an empty AppleScript command."""
         self._tell_app: Optional[str] = None
         self._commands: List[str] = []
-        self._converter = PythonToAppleScriptConverter()
+        self._converter = _CONVERTER
         self._raw_script: Optional[str] = None
+        self._run_argv = False
 
     def tell(self, application: str) -> "AppleScriptCommand":
         """
@@ -64,7 +70,7 @@ class AppleScriptCommand:
             Self for method chaining
         """
         # Handle special case where 'to' value is already an AppleScript expression
-        if isinstance(to, str) and hasattr(self._converter, '_is_applescript_expression') and self._converter._is_applescript_expression(to):
+        if isinstance(to, str) and self._converter._is_applescript_expression(to):
             value_str = to
         else:
             value_str = self._converter.convert(to)
@@ -105,16 +111,16 @@ class AppleScriptCommand:
         Returns:
             Self for method chaining
         """
-        cmd = f"make new {class_name}"
+        parts = [f"make new {class_name}"]
 
         if with_properties:
             props_str = self._build_properties_record(with_properties)
-            cmd += f" with properties {props_str}"
+            parts.append(f"with properties {props_str}")
 
         if at:
-            cmd += f" at {at}"
+            parts.append(f"at {at}")
 
-        self._commands.append(cmd)
+        self._commands.append(" ".join(parts))
         return self
 
     def delete(self, object_ref: str) -> "AppleScriptCommand":
@@ -170,6 +176,19 @@ class AppleScriptCommand:
         self._raw_script = script
         return self
 
+    def with_argv(self) -> "AppleScriptCommand":
+        """
+        Wrap the script in an "on run argv" handler.
+
+        Commands can refer to arguments as "item 1 of argv", so the same
+        script can be compiled once and run with different arguments.
+
+        Returns:
+            Self for method chaining
+        """
+        self._run_argv = True
+        return self
+
     def with_properties(self, properties: Dict[str, Any]) -> "AppleScriptCommand":
         """
         Convenience method to set multiple properties at once.
@@ -184,17 +203,29 @@ class AppleScriptCommand:
         self._commands.append(f"with properties {props_str}")
         return self
 
-    def _build_properties_record(self, properties: Dict[str, Any]) -> str:
-        """Build an AppleScript record from a dictionary."""
-        if not properties:
-            return "{}"
+    def inner_commands(self) -> Optional[List[str]]:
+        """
+        Get the commands to run inside the tell block, if any.
+
+        Returns:
+            List of command strings, or None if the command is a raw
+            script or wrapped in a run handler
+
+        Raises:
+            ValueError: If no commands have been added
+        """
+        if self._raw_script is not None or self._run_argv:
+            return None
 
-        items = []
-        for key, value in properties.items():
-            value_str = self._converter.convert(value)
-            items.append(f"{key}:{value_str}")
+        if not self._commands:
+            raise ValueError("No commands added to build")
 
-        return "{" + ", ".join(items) + "}"
+        return list(self._commands)
+
+    def _build_properties_record(self, properties: Dict[str, Any]) -> str:
+        """Build an AppleScript record from a dictionary."""
+        # A dict converts to a record, with all values in one conversion pass
+        return self._converter.convert(properties)
 
     def build(self) -> str:
         """
@@ -214,14 +245,31 @@ class AppleScriptCommand:
         if not self._commands:
             raise ValueError("No commands added to build")
 
+        # Collect every line of the script and join them once at the end
+        lines: List[str] = []
+
+        # Wrap in a run handler so arguments can be passed at execution time
+        indent = "    " if self._run_argv else ""
+        if self._run_argv:
+            lines.append("on run argv")
+
         # If tell application is set, wrap commands
+        command_indent = indent
         if self._tell_app:
-            # Join commands with newlines and proper indentation
-            commands_str = "\n    ".join(self._commands)
-            return f'tell application "{self._tell_app}"\n    {commands_str}\nend tell'
-        else:
-            # Return commands without tell block
-            return "\n".join(self._commands)
+            lines.append(f'{indent}tell application "{self._tell_app}"')
+            command_indent += "    "
+
+        # All commands go in as one string, indented through the separator.
+        # Lines inside a command are left as they are, as they may be part
+        # of a multiline string literal
+        lines.append(command_indent + f"\n{command_indent}".join(self._commands))
+
+        if self._tell_app:
+            lines.append(f"{indent}end tell")
+        if self._run_argv:
+            lines.append("end run")
+
+        return "\n".join(lines)
 
 
 class CommandBuilder:
@@ -251,6 +299,8 @@ class TellBlockBuilder:
     within the same tell application block.
     """
 
+    __slots__ = ("application", "commands")
+
     def __init__(self, application: str):
         """
         Initialize the tell block builder.
@@ -272,17 +322,12 @@ class TellBlockBuilder:
             Self for method chaining
         """
         if isinstance(command, AppleScriptCommand):
-            # Extract commands from the AppleScriptCommand
-            # This assumes the command was built without a tell block
-            script = command.build()
-            # If it has a tell block, extract the inner commands
-            if script.startswith("tell application"):
-                # Extract commands between tell and end tell
-                lines = script.split("\n")
-                for line in lines[1:-1]:  # Skip first and last lines
-                    self.commands.append(line.strip())
+            inner_commands = command.inner_commands()
+            if inner_commands is not None:
+                # Take the commands directly, without any tell block
+                self.commands.extend(inner_commands)
             else:
-                self.commands.append(script)
+                self.commands.append(command.build())
         else:
             self.commands.append(command)
 
@@ -305,6 +350,8 @@ class TellBlockBuilder:
 class ConditionalBuilder:
     """Helper for building if-then-else statements."""
 
+    __slots__ = ("condition", "then_commands", "else_commands")
+
     def __init__(self, condition: str):
         """
         Initialize conditional builder.
@@ -328,24 +375,22 @@ class ConditionalBuilder:
 
     def build(self) -> str:
         """Build the if-then-else statement."""
-        result = f"if {self.condition} then\n"
-
-        if self.then_commands:
-            for cmd in self.then_commands:
-                result += f"    {cmd}\n"
+        lines = [f"if {self.condition} then"]
+        lines.extend(f"    {cmd}" for cmd in self.then_commands)
 
         if self.else_commands:
-            result += "else\n"
-            for cmd in self.else_commands:
-                result += f"    {cmd}\n"
+            lines.append("else")
+            lines.extend(f"    {cmd}" for cmd in self.else_commands)
 
-        result += "end if"
-        return result
+        lines.append("end if")
+        return "\n".join(lines)
 
 
 class RepeatLoopBuilder:
     """Helper for building repeat loops."""
 
+    __slots__ = ("times", "with_var", "in_list", "commands")
+
     def __init__(
         self,
         times: Optional[int] = None,
@@ -373,14 +418,13 @@ class RepeatLoopBuilder:
     def build(self) -> str:
         """Build the repeat loop."""
         if self.times is not None:
-            result = f"repeat {self.times} times\n"
+            lines = [f"repeat {self.times} times"]
         elif self.with_var and self.in_list:
-            result = f"repeat with {self.with_var} in {self.in_list}\n"
+            lines = [f"repeat with {self.with_var} in {self.in_list}"]
         else:
-            result = "repeat\n"
+            lines = ["repeat"]
 
-        for cmd in self.commands:
-            result += f"    {cmd}\n"
+        lines.extend(f"    {cmd}" for cmd in self.commands)
 
-        result += "end repeat"
-        return result
+        lines.append("end repeat")
+        return "\n".join(lines)
@@ -6,27 +6,15 @@ and their AppleScript representations.
 """
 
 import logging
-from abc import ABC, abstractmethod
+import re
+import threading
 from datetime import date, datetime
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Union
 
 logger = logging.getLogger(__name__)
 
 
-class TypeConverter(ABC):
-    """Abstract base class for type converters."""
-
-    @abstractmethod
-    def to_applescript(self, value: Any) -> str:
-        """Convert Python value to AppleScript representation."""
-        pass
-
-    @abstractmethod
-    def from_applescript(self, value: str) -> Any:
-        """Convert AppleScript value to Python representation."""
-        pass
-
-
 class PythonToAppleScriptConverter:
     """
     Converts Python types to their AppleScript string representation.
@@ -35,6 +23,27 @@ class PythonToAppleScriptConverter:
     strings that can be used in AppleScript commands.
     """
 
+    # AppleScript expressions that are passed through unquoted
+    EXPRESSION_PATTERN = re.compile(
+        r"\s*(?:"
+        # Special values and the current date
+        r"(?:current date|\(current date\)|missing value|true|false)\s*\Z"
+        # Relative dates: (current date) + (N * days)
+        r"|\(current date\)(?=.*[+-])(?=.*days)"
+        # Object references: area id "ABC", project "XYZ", ...
+        r"|(?:area|project|tag|list|to do id) (?=.*\S)"
+        r")",
+        re.DOTALL,
+    )
+
+    # Characters that must be escaped inside AppleScript string literals
+    ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+    def __init__(self):
+        """Initialize the converter."""
+        # Per-thread state of the conversion in progress
+        self._pass = threading.local()
+
     def convert(self, value: Any) -> str:
         """
         Convert a Python value to its AppleScript representation.
@@ -45,17 +54,31 @@ class PythonToAppleScriptConverter:
         Returns:
             AppleScript string representation
         """
+        # Today's date is looked up once per conversion, however many
+        # dates the value contains
+        self._pass.active = True
+        try:
+            return self._convert_value(value)
+        finally:
+            self._pass.active = False
+            self._pass.today = None
+
+    def _convert_value(self, value: Any) -> str:
+        """Convert a Python value, as part of the current conversion."""
+        # Exact types are dispatched with a single lookup
+        handler = self._HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(self, value)
+
+        # Subclasses of the supported types (e.g. str enums)
         if value is None:
             return "missing value"
         elif isinstance(value, bool):
-            return "true" if value else "false"
+            return self._convert_bool(value)
         elif isinstance(value, (int, float)):
             return str(value)
         elif isinstance(value, str):
-            # Check for special AppleScript expressions that should not be quoted
-            if self._is_applescript_expression(value):
-                return value
-            return self._quote_string(value)
+            return self._convert_string(value)
         elif isinstance(value, (date, datetime)):
             return self._format_date(value)
         elif isinstance(value, list):
@@ -66,6 +89,34 @@ class PythonToAppleScriptConverter:
             # Fallback: convert to string and quote
             return self._quote_string(str(value))
 
+    def _convert_bool(self, value: bool) -> str:
+        """Convert a boolean to AppleScript."""
+        return "true" if value else "false"
+
+    # Strings up to this length have their conversion cached; names, tags
+    # and references repeat across bulk operations, long notes rarely do
+    STRING_CACHE_MAX_LENGTH = 256
+
+    def _convert_string(self, value: str) -> str:
+        """Convert a string, leaving AppleScript expressions unquoted."""
+        if len(value) <= self.STRING_CACHE_MAX_LENGTH:
+            return self._convert_short_string(value)
+        return self._convert_string_uncached(value)
+
+    @classmethod
+    def _convert_string_uncached(cls, value: str) -> str:
+        """Convert a string without consulting the cache."""
+        # Check for special AppleScript expressions that should not be quoted
+        if cls.EXPRESSION_PATTERN.match(value) is not None:
+            return value
+        return f'"{value.translate(cls.ESCAPE_TABLE)}"'
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _convert_short_string(cls, value: str) -> str:
+        """Convert a short string, once per distinct string and class."""
+        return cls._convert_string_uncached(value)
+
     def _is_applescript_expression(self, s: str) -> bool:
         """
         Check if a string is an AppleScript expression that should not be quoted.
@@ -75,34 +126,12 @@ class PythonToAppleScriptConverter:
         - Object references: area id "ABC", project id "XYZ"
         - Special values: missing value, current date
         """
-        s = s.strip()
-        
-        # Date expressions
-        if s == "current date" or s == "(current date)":
-            return True
-        if s.startswith("(current date)") and ("+" in s or "-" in s) and "days" in s:
-            return True
-            
-        # Object references
-        reference_prefixes = [
-            "area id ", "project id ", "tag id ", "to do id ",
-            "area ", "project ", "tag ", "list "
-        ]
-        for prefix in reference_prefixes:
-            if s.startswith(prefix):
-                return True
-                
-        # Special AppleScript values
-        if s in ["missing value", "true", "false"]:
-            return True
-            
-        return False
+        return self.EXPRESSION_PATTERN.match(s) is not None
 
     def _quote_string(self, s: str) -> str:
         """Quote a string for AppleScript."""
-        # Escape internal quotes
-        escaped = s.replace('"', '\\"')
-        return f'"{escaped}"'
+        # Escape backslashes and internal quotes in a single pass
+        return f'"{s.translate(self.ESCAPE_TABLE)}"'
 
     def _format_date(self, d: Union[date, datetime]) -> str:
         """
@@ -111,13 +140,16 @@ class PythonToAppleScriptConverter:
         Returns a date expression like 'current date' or
         '(current date) + (N * days)' for relative dates.
         """
-        if isinstance(d, date) and not isinstance(d, datetime):
-            d = datetime.combine(d, datetime.min.time())
+        # Only the calendar day matters
+        target_date = d.date() if isinstance(d, datetime) else d
 
         # Calculate days difference from today
-        today = datetime.now().date()
-        target_date = d.date()
-        days_diff = (target_date - today).days
+        today = getattr(self._pass, "today", None)
+        if today is None:
+            today = datetime.now().date()
+            if getattr(self._pass, "active", False):
+                self._pass.today = today
+        days_diff = target_date.toordinal() - today.toordinal()
 
         # Generate AppleScript date expression
         if days_diff == 0:
@@ -136,20 +168,31 @@ class PythonToAppleScriptConverter:
         if not lst:
             return "{}"
 
-        items = [self.convert(item) for item in lst]
-        return "{" + ", ".join(items) + "}"
+        items = [self._convert_value(item) for item in lst]
+        return f"{{{', '.join(items)}}}"
 
     def _convert_dict(self, d: Dict[str, Any]) -> str:
         """Convert a Python dict to AppleScript record format."""
         if not d:
             return "{}"
 
-        items = []
-        for key, value in d.items():
-            # Keys in AppleScript records are not quoted
-            items.append(f"{key}:{self.convert(value)}")
-
-        return "{" + ", ".join(items) + "}"
+        # Keys in AppleScript records are not quoted
+        convert = self._convert_value
+        items = [f"{key}:{convert(value)}" for key, value in d.items()]
+        return f"{{{', '.join(items)}}}"
+
+    # Conversion handlers by exact type
+    _HANDLERS: Dict[type, Callable[[Any, Any], str]] = {
+        type(None): lambda self, value: "missing value",
+        bool: _convert_bool,
+        int: lambda self, value: str(value),
+        float: lambda self, value: str(value),
+        str: _convert_string,
+        date: _format_date,
+        datetime: _format_date,
+        list: _convert_list,
+        dict: _convert_dict,
+    }
 
 
 class AppleScriptReferenceConverter:
@@ -160,26 +203,18 @@ class AppleScriptReferenceConverter:
     AppleScript objects like 'project id "ABC123"' or 'area "Work"'.
     """
 
-    REFERENCE_PATTERNS = {
-        "project": r"project (?:id )?",
-        "area": r"area (?:id )?",
-        "tag": r"tag ",
-        "todo": r"to do (?:id )?",
-        "list": r"list ",
-    }
+    # Reference prefixes; each also covers its "<type> id " form
+    REFERENCE_PREFIXES = ("project ", "area ", "tag ", "to do ", "list ")
+
+    # Quoted references: ('type', ' id' or None, 'identifier')
+    PARSE_PATTERN = re.compile(r'(project|area|tag|todo|list)( id)? "(.*)"\Z', re.DOTALL)
 
     def is_reference(self, value: str) -> bool:
         """Check if a value is an AppleScript object reference."""
         if not isinstance(value, str):
             return False
 
-        for pattern in self.REFERENCE_PATTERNS.values():
-            if value.startswith(pattern.replace("(?:id )?", "id ")) or value.startswith(
-                pattern.replace("(?:id )?", "")
-            ):
-                return True
-
-        return False
+        return value.startswith(self.REFERENCE_PREFIXES)
 
     def format_reference(
         self, ref_type: str, identifier: str, by_id: bool = True
@@ -210,17 +245,10 @@ class AppleScriptReferenceConverter:
         Returns:
             Tuple of (type, identifier, is_by_id)
         """
-        for ref_type, pattern in self.REFERENCE_PATTERNS.items():
-            if reference.startswith(f"{ref_type} id "):
-                # Extract ID from quotes
-                id_part = reference[len(f"{ref_type} id ") :]
-                if id_part.startswith('"') and id_part.endswith('"'):
-                    return ref_type, id_part[1:-1], True
-            elif reference.startswith(f"{ref_type} "):
-                # Extract name from quotes
-                name_part = reference[len(f"{ref_type} ") :]
-                if name_part.startswith('"') and name_part.endswith('"'):
-                    return ref_type, name_part[1:-1], False
+        match = self.PARSE_PATTERN.match(reference)
+        if match:
+            ref_type, by_id, identifier = match.groups()
+            return ref_type, identifier, by_id is not None
 
         return None, None, None
 
@@ -278,12 +306,6 @@ class PropertyConverter:
         Returns:
             Dictionary with converted keys
         """
-        result = {}
-        for key, value in data.items():
-            if to_applescript:
-                new_key = self.to_applescript_name(key)
-            else:
-                new_key = self.to_python_name(key)
-            result[new_key] = value
-
-        return result
+        # Both directions share one map, so every key is a single dict lookup
+        rename = self.PROPERTY_MAP.get
+        return {rename(key, key): value for key, value in data.items()}
@@ -5,18 +5,139 @@ This module provides a pure AppleScript execution engine without any
 parsing or application-specific logic.
 """
 
+import atexit
+import hashlib
+import json
 import logging
+import os
+import selectors
 import subprocess
+import tempfile
+import threading
+import time
+import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, cast
 
 from applescript.errors import (
+    AppleScriptBatchError,
     AppleScriptExecutionError,
+    AppleScriptHostError,
     AppleScriptTimeoutError,
 )
 
 logger = logging.getLogger(__name__)
 
+# JavaScript for Automation loop run by the persistent host process. It reads
+# framed requests ("<mode>\n<script>\n<sentinel>\n") from stdin, runs each
+# script through OSAKit and writes a framed reply ("<status>\n<output>\n<sentinel>\n").
+# Mode "s" returns the structured (source) form like "osascript -s s";
+# mode "h" returns the human-readable form like plain "osascript".
+# A mode followed by a JSON list of arguments ("s [\"ABC\"]") makes the
+# script the path of a compiled .scpt file, whose run handler is called
+# with those arguments; loaded files are kept for later requests.
+_HOST_SCRIPT = r"""
+ObjC.import("Foundation");
+ObjC.import("OSAKit");
+
+var loaded = {};
+
+function failure(errorInfo) {
+    var info = errorInfo[0];
+    var message = ObjC.unwrap(info.objectForKey($.OSAScriptErrorMessageKey));
+    var number = ObjC.unwrap(info.objectForKey($.OSAScriptErrorNumberKey));
+    return "error " + (number || 1) + "\n" + (message || "AppleScript error");
+}
+
+function execute(source, mode, language) {
+    var script = $.OSAScript.alloc.initWithSourceLanguage($(source), language);
+    var display = Ref();
+    var errorInfo = Ref();
+    var result = script.executeAndReturnDisplayValueError(display, errorInfo);
+
+    if (result.isNil()) {
+        return failure(errorInfo);
+    }
+
+    if (mode == "h" && !result.stringValue.isNil()) {
+        return "ok\n" + result.stringValue.js;
+    }
+    return "ok\n" + (display[0].isNil() ? "" : display[0].string.js);
+}
+
+function executeFile(path, args, mode) {
+    var script = loaded[path];
+    if (script === undefined) {
+        var url = $.NSURL.fileURLWithPath($(path));
+        script = $.OSAScript.alloc.initWithContentsOfURLError(url, Ref());
+        if (script.isNil()) {
+            return "error 1\nCould not load compiled script " + path;
+        }
+        loaded[path] = script;
+    }
+
+    var errorInfo = Ref();
+    var result = script.executeHandlerWithNameArgumentsError($("run"), $([args]), errorInfo);
+
+    if (result.isNil()) {
+        return failure(errorInfo);
+    }
+
+    if (mode == "h" && !result.stringValue.isNil()) {
+        return "ok\n" + result.stringValue.js;
+    }
+    var display = script.richTextFromDescriptor(result);
+    return "ok\n" + (display.isNil() ? "" : display.string.js);
+}
+
+function handle(request, language) {
+    var newline = request.indexOf("\n");
+    var header = request.slice(0, newline);
+    var body = request.slice(newline + 1);
+    var space = header.indexOf(" ");
+    if (space == -1) {
+        return execute(body, header, language);
+    }
+    return executeFile(body, JSON.parse(header.slice(space + 1)), header.slice(0, space));
+}
+
+function run(argv) {
+    var marker = "\n" + argv[0] + "\n";
+    var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+    var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+    var language = $.OSALanguage.languageForName("AppleScript");
+    var pending = $.NSMutableData.data;
+
+    while (true) {
+        var data = stdin.availableData;
+        if (data.length == 0) {
+            return;
+        }
+        pending.appendData(data);
+
+        // Wait for more data if a multi-byte character was split
+        var text = $.NSString.alloc.initWithDataEncoding(pending, $.NSUTF8StringEncoding);
+        if (text.isNil()) {
+            continue;
+        }
+        text = text.js;
+
+        var end = text.indexOf(marker);
+        if (end == -1) {
+            continue;
+        }
+        while (end != -1) {
+            var request = text.slice(0, end);
+            text = text.slice(end + marker.length);
+            var reply = handle(request, language);
+            stdout.writeData($(reply + marker).dataUsingEncoding($.NSUTF8StringEncoding));
+            end = text.indexOf(marker);
+        }
+        pending = $.NSMutableData.dataWithData($(text).dataUsingEncoding($.NSUTF8StringEncoding));
+    }
+}
+"""
+
 
 class AppleScriptEngine:
     """
@@ -28,14 +149,35 @@ class AppleScriptEngine:
 
     DEFAULT_TIMEOUT = 30.0  # seconds
 
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_dir: Optional[Path] = None,
+        persistent: bool = False,
+    ):
         """
         Initialize the AppleScript engine.
 
         Args:
             timeout: Default timeout for script execution in seconds
+            cache_dir: Directory for compiled scripts (defaults to a temp directory)
+            persistent: Run scripts in one long-lived osascript process
+                instead of spawning osascript for every call
         """
         self.timeout = timeout
+        self._cmd_base = ("osascript",)
+        # The default directory is per user, as compiled scripts found in it
+        # are executed without further checks
+        self.cache_dir = cache_dir or (
+            Path(tempfile.gettempdir()) / f"applescript-cache-{os.getuid()}"
+        )
+        self._compiled: Dict[str, Path] = {}
+        # One lock per script digest, so each script is compiled only once
+        # even when first requested by several threads at the same time
+        self._compile_locks: Dict[str, threading.Lock] = {}
+        self._compile_locks_lock = threading.Lock()
+        self._cache_dir_checked = False
+        self._host: Optional[AppleScriptHost] = AppleScriptHost() if persistent else None
 
     def execute(
         self,
@@ -58,34 +200,52 @@ class AppleScriptEngine:
             AppleScriptExecutionError: If the script execution fails
             AppleScriptTimeoutError: If the script execution times out
         """
-        cmd = ["osascript"]
-
-        if flags:
-            cmd.extend(flags)
+        timeout_value = timeout or self.timeout
 
-        cmd.extend(["-e", script])
+        # The persistent host supports the default and structured output formats
+        if self._host is not None and flags in (None, [], ["-s", "s"]):
+            try:
+                return self._host.execute(
+                    script, structured=bool(flags), timeout=timeout_value
+                )
+            except AppleScriptHostError as e:
+                # The script never reached the host, so it is safe to rerun
+                logger.warning("Falling back to one-shot osascript: %s", e)
 
-        timeout_value = timeout or self.timeout
+        # The script is read from stdin ("-"), so large scripts such as
+        # batches are not limited by, or copied through, the argument list
+        cmd = [*self._cmd_base, *(flags or ()), "-"]
 
-        logger.debug(f"Executing AppleScript with command: {cmd}")
-        logger.debug(f"Script content: {script}")
+        logger.debug("Executing AppleScript with command: %s", cmd)
+        logger.debug("Script content: %s", script)
 
         try:
+            # Python opens files non-inheritable, so there are no descriptors
+            # to close in the child, and skipping that lets subprocess use
+            # posix_spawn instead of fork/exec. osascript writes UTF-8,
+            # so the output is decoded as such rather than with the locale
+            # codec, which may be ASCII for a server started by launchd
             result = subprocess.run(
-                cmd, capture_output=True, text=True, check=True, timeout=timeout_value
+                cmd,
+                input=script,
+                capture_output=True,
+                encoding="utf-8",
+                check=True,
+                timeout=timeout_value,
+                close_fds=False,
             )
 
             output = result.stdout.strip()
-            logger.debug(f"AppleScript output: {output}")
+            logger.debug("AppleScript output: %s", output)
 
             return output
 
         except subprocess.TimeoutExpired:
-            logger.error(f"AppleScript execution timed out after {timeout_value}s")
+            logger.error("AppleScript execution timed out after %ss", timeout_value)
             raise AppleScriptTimeoutError(timeout_value, script)
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"AppleScript execution failed: {e.stderr}")
+            logger.error("AppleScript execution failed: %s", e.stderr)
             raise AppleScriptExecutionError(
                 "AppleScript execution failed", e.stderr, e.returncode, script
             )
@@ -95,14 +255,18 @@ class AppleScriptEngine:
         file_path: Path,
         flags: Optional[List[str]] = None,
         timeout: Optional[float] = None,
+        args: Optional[List[str]] = None,
     ) -> str:
         """
         Execute an AppleScript file and return its raw output.
 
+        With a persistent engine, the file runs in the long-lived host.
+
         Args:
             file_path: Path to the AppleScript file
             flags: Optional list of osascript flags
             timeout: Timeout in seconds (uses default if not specified)
+            args: Optional arguments passed to the script's run handler
 
         Returns:
             Raw output from the AppleScript execution
@@ -115,33 +279,43 @@ class AppleScriptEngine:
         if not file_path.exists():
             raise FileNotFoundError(f"AppleScript file not found: {file_path}")
 
-        cmd = ["osascript"]
-
-        if flags:
-            cmd.extend(flags)
+        timeout_value = timeout or self.timeout
 
-        cmd.append(str(file_path))
+        # The persistent host supports the default and structured output formats
+        if self._host is not None and flags in (None, [], ["-s", "s"]):
+            try:
+                return self._host.execute_file(
+                    file_path, list(args or ()), bool(flags), timeout_value
+                )
+            except AppleScriptHostError as e:
+                # The script never reached the host, so it is safe to rerun
+                logger.warning("Falling back to one-shot osascript: %s", e)
 
-        timeout_value = timeout or self.timeout
+        cmd = [*self._cmd_base, *(flags or ()), str(file_path), *(args or ())]
 
-        logger.debug(f"Executing AppleScript file: {file_path}")
+        logger.debug("Executing AppleScript file: %s", file_path)
 
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, check=True, timeout=timeout_value
+                cmd,
+                capture_output=True,
+                encoding="utf-8",
+                check=True,
+                timeout=timeout_value,
+                close_fds=False,
             )
 
             output = result.stdout.strip()
-            logger.debug(f"AppleScript output: {output}")
+            logger.debug("AppleScript output: %s", output)
 
             return output
 
         except subprocess.TimeoutExpired:
-            logger.error(f"AppleScript execution timed out after {timeout_value}s")
+            logger.error("AppleScript execution timed out after %ss", timeout_value)
             raise AppleScriptTimeoutError(timeout_value, str(file_path))
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"AppleScript execution failed: {e.stderr}")
+            logger.error("AppleScript execution failed: %s", e.stderr)
             raise AppleScriptExecutionError(
                 "AppleScript file execution failed",
                 e.stderr,
@@ -149,6 +323,132 @@ class AppleScriptEngine:
                 str(file_path),
             )
 
+    def execute_compiled(
+        self,
+        name: str,
+        source: str,
+        args: Optional[List[str]] = None,
+        flags: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Execute an AppleScript from a compiled script cache.
+
+        The source is compiled once with osacompile and the resulting
+        .scpt file is reused on later calls, so osascript skips parsing
+        and compiling the script. Per-call values should be passed as
+        arguments and read from the script's "on run argv" handler.
+
+        Args:
+            name: Short name for the script, used in the cache file name
+            source: The AppleScript source code
+            args: Optional arguments passed to the script's run handler
+            flags: Optional list of osascript flags
+            timeout: Timeout in seconds (uses default if not specified)
+
+        Returns:
+            Raw output from the AppleScript execution
+
+        Raises:
+            AppleScriptExecutionError: If compilation or execution fails
+            AppleScriptTimeoutError: If the script execution times out
+        """
+        script_path = self._ensure_compiled(name, source)
+        return self.execute_file(script_path, flags=flags, timeout=timeout, args=args)
+
+    def _ensure_compiled(self, name: str, source: str) -> Path:
+        """
+        Compile an AppleScript source to a .scpt file unless already cached.
+
+        Args:
+            name: Short name for the script, used in the cache file name
+            source: The AppleScript source code
+
+        Returns:
+            Path to the compiled script
+
+        Raises:
+            AppleScriptExecutionError: If compilation fails, or the cache
+                directory belongs to another user
+            AppleScriptTimeoutError: If compilation times out
+        """
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+        script_path = self._compiled.get(digest)
+        if script_path is not None and script_path.exists():
+            return script_path
+
+        with self._compile_locks_lock:
+            lock = self._compile_locks.setdefault(digest, threading.Lock())
+
+        with lock:
+            self._check_cache_dir()
+            script_path = self.cache_dir / f"{name}-{digest}.scpt"
+
+            if not script_path.exists():
+                self._compile(source, script_path)
+
+            self._compiled[digest] = script_path
+
+        return script_path
+
+    def _check_cache_dir(self) -> None:
+        """
+        Create the compiled script directory, private to the current user.
+
+        Raises:
+            AppleScriptExecutionError: If the directory belongs to another user
+        """
+        if self._cache_dir_checked:
+            return
+
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = self.cache_dir.stat()
+        if info.st_uid != os.getuid():
+            raise AppleScriptExecutionError(
+                "AppleScript cache directory belongs to another user",
+                str(self.cache_dir),
+                1,
+            )
+        if info.st_mode & 0o077:
+            os.chmod(self.cache_dir, 0o700)
+
+        self._cache_dir_checked = True
+
+    def _compile(self, source: str, script_path: Path) -> None:
+        """
+        Compile an AppleScript source to script_path.
+
+        The script is compiled to a temporary file that is then moved into
+        place, so a half-written script is never found at script_path.
+
+        Raises:
+            AppleScriptExecutionError: If compilation fails
+            AppleScriptTimeoutError: If compilation times out
+        """
+        temp_path = script_path.with_name(f".{uuid.uuid4().hex}-{script_path.name}")
+        logger.debug("Compiling AppleScript to %s", script_path)
+
+        try:
+            subprocess.run(
+                ["osacompile", "-o", str(temp_path), "-e", source],
+                capture_output=True,
+                encoding="utf-8",
+                check=True,
+                timeout=self.timeout,
+            )
+            os.replace(temp_path, script_path)
+        except subprocess.TimeoutExpired:
+            logger.error("AppleScript compilation timed out after %ss", self.timeout)
+            raise AppleScriptTimeoutError(self.timeout, source)
+        except subprocess.CalledProcessError as e:
+            logger.error("AppleScript compilation failed: %s", e.stderr)
+            raise AppleScriptExecutionError(
+                "AppleScript compilation failed", e.stderr, e.returncode, source
+            )
+        finally:
+            temp_path.unlink(missing_ok=True)
+
     def execute_structured(self, script: str, timeout: Optional[float] = None) -> str:
         """
         Execute an AppleScript with structured output format.
@@ -164,3 +464,305 @@ class AppleScriptEngine:
             Raw structured output from the AppleScript execution
         """
         return self.execute(script, flags=["-s", "s"], timeout=timeout)
+
+    def execute_batch(
+        self, scripts: List[str], timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Execute several AppleScripts in a single osascript invocation.
+
+        Each script runs as its own script object, in order, and its
+        result is coerced to text. A failing script does not stop the
+        ones after it, and is not rolled back; the first failure is raised
+        once the batch is done, carrying the outputs of the other scripts.
+
+        Args:
+            scripts: The AppleScript code to execute, one entry per script
+            timeout: Timeout in seconds for the whole batch (uses default if not specified)
+
+        Returns:
+            Raw output of each script, in the same order as the scripts
+
+        Raises:
+            AppleScriptBatchError: If any script in the batch fails; its
+                results hold the output of each script, None if it failed
+            AppleScriptExecutionError: If the batch itself fails
+            AppleScriptTimeoutError: If the batch execution times out
+        """
+        if not scripts:
+            return []
+
+        separator = f"__APPLESCRIPT_BATCH_{uuid.uuid4().hex}__"
+        output = self.execute(self._build_batch(scripts, separator), timeout=timeout)
+
+        # Each reply is "<status>\n<output>", prefixed by the separator
+        replies = output.split(separator)[1:]
+        if len(replies) != len(scripts):
+            raise AppleScriptExecutionError(
+                "AppleScript batch returned an unexpected number of results",
+                output,
+                1,
+                scripts[0],
+            )
+
+        results: List[Optional[str]] = []
+        failure = None
+        for index, reply in enumerate(replies):
+            status, _, text = reply.partition("\n")
+            if status == "ok":
+                results.append(text.strip())
+                continue
+
+            logger.error("AppleScript batch script %s failed: %s", index, text)
+            results.append(None)
+            if failure is None:
+                failure = (index, text, int(status.partition(" ")[2] or 1))
+
+        if failure is not None:
+            index, text, returncode = failure
+            raise AppleScriptBatchError(
+                f"AppleScript batch script {index} failed",
+                text,
+                returncode,
+                scripts[index],
+                results,
+            )
+
+        # Only failed scripts leave None, so every result is a str here
+        return cast(List[str], results)
+
+    def _build_batch(self, scripts: List[str], separator: str) -> str:
+        """
+        Combine scripts into one AppleScript that returns all of their results.
+
+        Args:
+            scripts: The AppleScript code of each script
+            separator: Marker written before each script's result
+
+        Returns:
+            Combined AppleScript source
+        """
+        lines = ['set batchOutput to ""']
+
+        for index, script in enumerate(scripts):
+            # Scripts go in unchanged: indenting their lines would also
+            # indent the continuation lines of multiline string literals
+            lines.extend([f"script batchScript{index}", script])
+            lines.extend(
+                [
+                    "end script",
+                    "try",
+                    f"    set batchResult to run batchScript{index}",
+                    "    try",
+                    "        set batchText to batchResult as text",
+                    "    on error",
+                    '        set batchText to ""',
+                    "    end try",
+                    f'    set batchOutput to batchOutput & "{separator}ok" & linefeed & batchText',
+                    "on error errMsg number errNum",
+                    "    -- Error -2763 means the script returned no result",
+                    "    if errNum is -2763 then",
+                    f'        set batchOutput to batchOutput & "{separator}ok" & linefeed',
+                    "    else",
+                    f'        set batchOutput to batchOutput & "{separator}error " & errNum & linefeed & errMsg',
+                    "    end if",
+                    "end try",
+                ]
+            )
+
+        lines.append("return batchOutput")
+        return "\n".join(lines)
+
+
+class AppleScriptHost:
+    """
+    Long-lived osascript process that runs AppleScripts sent over stdin.
+
+    Spawning osascript costs far more than running a typical query, so
+    the host keeps one process alive and exchanges scripts and results
+    with it over pipes. Requests and replies are framed by a random
+    per-process sentinel line.
+    """
+
+    def __init__(self):
+        """Initialize the host. The osascript process is started on first use."""
+        self._proc: Optional[subprocess.Popen] = None
+        self._sentinel = ""
+        self._buffer = b""
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def execute(self, script: str, structured: bool, timeout: float) -> str:
+        """
+        Run a script in the host process and return its output.
+
+        Args:
+            script: The AppleScript code to execute
+            structured: Return the structured (source) form, like "osascript -s s"
+            timeout: Timeout in seconds
+
+        Returns:
+            Raw output from the AppleScript execution
+
+        Raises:
+            AppleScriptHostError: If the host could not be started or the
+                script could not be sent to it
+            AppleScriptExecutionError: If the script execution fails
+            AppleScriptTimeoutError: If the script execution times out
+        """
+        logger.debug("Executing AppleScript in persistent host: %s", script)
+
+        mode = "s" if structured else "h"
+        return self._request(mode, script, script, timeout)
+
+    def execute_file(
+        self, file_path: Path, args: List[str], structured: bool, timeout: float
+    ) -> str:
+        """
+        Run a compiled script file's run handler in the host process.
+
+        The host loads each file once and keeps it, so later calls only
+        pass their arguments.
+
+        Args:
+            file_path: Path to the compiled .scpt file
+            args: Arguments passed to the script's run handler
+            structured: Return the structured (source) form, like "osascript -s s"
+            timeout: Timeout in seconds
+
+        Returns:
+            Raw output from the AppleScript execution
+
+        Raises:
+            AppleScriptHostError: If the host could not be started or the
+                request could not be sent to it
+            AppleScriptExecutionError: If the script execution fails
+            AppleScriptTimeoutError: If the script execution times out
+        """
+        logger.debug("Executing AppleScript file in persistent host: %s", file_path)
+
+        # JSON keeps the arguments on the single header line
+        header = f"{'s' if structured else 'h'} {json.dumps(args)}"
+        return self._request(header, str(file_path), str(file_path), timeout)
+
+    def _request(self, header: str, body: str, script: str, timeout: float) -> str:
+        """
+        Send one framed request to the host and return its output.
+
+        Args:
+            header: First line of the request: the mode, and any arguments
+            body: The script source or compiled script path
+            script: What to report as the script in errors
+            timeout: Timeout in seconds
+        """
+        with self._lock:
+            try:
+                process = self._proc
+                if process is None or process.poll() is not None:
+                    process = self._start()
+
+                # The host is started with pipes, so both are always set
+                assert process.stdin is not None and process.stdout is not None
+
+                request = f"{header}\n{body}\n{self._sentinel}\n"
+                process.stdin.write(request.encode("utf-8"))
+                process.stdin.flush()
+            except OSError as e:
+                logger.error("AppleScript host unavailable: %s", e)
+                self._stop()
+                raise AppleScriptHostError(
+                    "AppleScript host unavailable", str(e), 1, script
+                )
+
+            try:
+                status, output = self._read_reply(
+                    process.stdout.fileno(), time.monotonic() + timeout
+                )
+            except TimeoutError:
+                logger.error("AppleScript execution timed out after %ss", timeout)
+                self._stop()
+                raise AppleScriptTimeoutError(timeout, script)
+            except OSError as e:
+                logger.error("AppleScript host failed: %s", e)
+                self._stop()
+                raise AppleScriptExecutionError(
+                    "AppleScript host failed", str(e), 1, script
+                )
+
+        if status != "ok":
+            logger.error("AppleScript execution failed: %s", output)
+            returncode = int(status.partition(" ")[2] or 1)
+            raise AppleScriptExecutionError(
+                "AppleScript execution failed", output, returncode, script
+            )
+
+        output = output.strip()
+        logger.debug("AppleScript output: %s", output)
+        return output
+
+    def close(self) -> None:
+        """Terminate the host process if it is running."""
+        with self._lock:
+            self._stop()
+
+    def _command(self) -> List[str]:
+        """Build the command line that starts the host process."""
+        return ["osascript", "-l", "JavaScript", "-e", _HOST_SCRIPT, self._sentinel]
+
+    def _start(self) -> subprocess.Popen:
+        """Start a fresh host process and return it."""
+        self._stop()
+        self._sentinel = f"__APPLESCRIPT_HOST_{uuid.uuid4().hex}__"
+        self._buffer = b""
+        logger.debug("Starting persistent AppleScript host")
+        self._proc = subprocess.Popen(
+            self._command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        return self._proc
+
+    def _stop(self) -> None:
+        """Kill the host process, if any, without taking the lock."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.kill()
+            self._proc.wait()
+        except OSError:
+            pass
+        self._proc = None
+
+    def _read_reply(self, fd: int, deadline: float) -> tuple[str, str]:
+        """
+        Read one framed reply from the host.
+
+        Args:
+            fd: File descriptor of the host's stdout
+            deadline: time.monotonic() value by which the reply must arrive
+
+        Returns:
+            Tuple of (status, output)
+
+        Raises:
+            TimeoutError: If no complete reply arrives before the deadline
+            OSError: If the host exits before replying
+        """
+        marker = f"\n{self._sentinel}\n".encode("utf-8")
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while marker not in self._buffer:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    raise TimeoutError("No reply from AppleScript host")
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise OSError("AppleScript host exited unexpectedly")
+                self._buffer += chunk
+
+        reply, _, self._buffer = self._buffer.partition(marker)
+        status, _, output = reply.decode("utf-8").partition("\n")
+        return status, output
@@ -2,7 +2,7 @@
 AppleScript error types for better error handling and debugging.
 """
 
-from typing import Optional
+from typing import Any, List, Optional
 
 
 class AppleScriptError(Exception):
@@ -22,15 +22,45 @@ class AppleScriptExecutionError(AppleScriptError):
         self.returncode = returncode
         self.script = script
 
+        # Built once, as errors are often logged and re-raised several times
+        parts = [message]
+        if stderr:
+            parts.append(f"Error output: {stderr}")
+        if returncode:
+            parts.append(f"Return code: {returncode}")
+        if script:
+            parts.append(f"Script: {script[:100]}...")
+        self._str = " | ".join(parts)
+
     def __str__(self) -> str:
-        parts = [super().__str__()]
-        if self.stderr:
-            parts.append(f"Error output: {self.stderr}")
-        if self.returncode:
-            parts.append(f"Return code: {self.returncode}")
-        if self.script:
-            parts.append(f"Script: {self.script[:100]}...")
-        return " | ".join(parts)
+        return self._str
+
+
+class AppleScriptHostError(AppleScriptExecutionError):
+    """Raised when a script could not be sent to the persistent osascript host."""
+
+    pass
+
+
+class AppleScriptBatchError(AppleScriptExecutionError):
+    """
+    Raised when a script in a batch fails.
+
+    The other scripts of the batch still ran, and their effects (e.g.
+    created todos) are not undone. Their outputs are kept in results,
+    with None for each script that failed.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        stderr: str,
+        returncode: int,
+        script: Optional[str] = None,
+        results: Optional[List[Optional[Any]]] = None,
+    ):
+        super().__init__(message, stderr, returncode, script)
+        self.results = results or []
 
 
 class AppleScriptParsingError(AppleScriptError):
@@ -49,9 +79,10 @@ class AppleScriptParsingError(AppleScriptError):
         self.raw_output = raw_output
         self.parser_type = parser_type
         self.original_error = original_error
+        self._str = f"{message} | Output: {raw_output[:100]}..."
 
     def __str__(self) -> str:
-        return f"{super().__str__()} | Output: {self.raw_output[:100]}..."
+        return self._str
 
 
 class AppleScriptTimeoutError(AppleScriptError):
@@ -8,37 +8,84 @@ AppleScript output formats into Python objects.
 import json
 import logging
 import re
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from applescript.errors import AppleScriptParsingError
 
+# orjson is used when installed; its decode error subclasses the stdlib one
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Boolean literals, matched case-insensitively
+_BOOLEANS = {"true": True, "false": False}
+_MAX_BOOLEAN_LENGTH = max(map(len, _BOOLEANS))
+
+
+def _parse_boolean(value: str) -> Optional[bool]:
+    """Return the boolean a literal stands for, or None if it is not one."""
+    # AppleScript prints lowercase literals, so lowercasing is a fallback
+    # for the few strings short enough to be one
+    boolean = _BOOLEANS.get(value)
+    if boolean is None and len(value) <= _MAX_BOOLEAN_LENGTH:
+        boolean = _BOOLEANS.get(value.lower())
+    return boolean
+
+
+# Numbers as AppleScript prints them; checked up front so that the many
+# non-numeric values never raise and catch a ValueError
+_INT_PATTERN = re.compile(r"[+-]?\d+")
+_FLOAT_PATTERN = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+def _parse_number(value: str) -> Optional[Union[int, float]]:
+    """Return the number a literal stands for, or None if it is not one."""
+    if _INT_PATTERN.fullmatch(value):
+        return int(value)
+    if _FLOAT_PATTERN.fullmatch(value):
+        return float(value)
+    return None
+
 
 class ParserStrategy(ABC):
     """Abstract base class for AppleScript output parsers."""
 
+    # First non-whitespace characters of the output this parser can
+    # handle; None means the parser is tried whatever the output starts with
+    leading_chars: Optional[str] = None
+
     @abstractmethod
-    def can_parse(self, raw_output: str) -> bool:
+    def can_parse(self, raw_output: str, stripped: Optional[str] = None) -> Any:
         """
         Check if this parser can handle the given output.
 
         Args:
             raw_output: Raw AppleScript output string
+            stripped: raw_output with surrounding whitespace removed, when
+                the caller has already computed it
 
         Returns:
-            True if this parser can handle the output
+            A truthy value if this parser can handle the output. Anything
+            other than True (e.g. a regex match) is handed back to parse
+            as its context.
         """
         pass
 
     @abstractmethod
-    def parse(self, raw_output: str) -> Any:
+    def parse(self, raw_output: str, context: Any = None) -> Any:
         """
         Parse the raw AppleScript output.
 
         Args:
             raw_output: Raw AppleScript output string
+            context: Value returned by can_parse for this output, if any
 
         Returns:
             Parsed Python object
@@ -52,28 +99,50 @@ class ParserStrategy(ABC):
 class JSONParser(ParserStrategy):
     """Parser for JSON-formatted AppleScript output."""
 
-    def can_parse(self, raw_output: str) -> bool:
-        """Check if output looks like JSON."""
+    leading_chars = "{["
+
+    # Start of a JSON object: empty, or a quoted first key and its colon.
+    # AppleScript records ({name:...}, {{...}}) and lists ({"a", "b"})
+    # never match, so they are not handed to the decoder at all
+    OBJECT_START = re.compile(r'\{\s*(?:\}|"(?:[^"\\]|\\.)*"\s*:)', re.DOTALL)
+
+    def can_parse(
+        self, raw_output: str, stripped: Optional[str] = None
+    ) -> Optional[tuple]:
+        """
+        Check if output is JSON by decoding it.
+
+        Returns:
+            A one-item tuple holding the decoded value, or None
+        """
         if not raw_output:
-            return False
+            return None
 
-        stripped = raw_output.strip()
+        if stripped is None:
+            stripped = raw_output.strip()
 
-        # JSON objects or arrays
-        if (stripped.startswith("{") and stripped.endswith("}")) or (
-            stripped.startswith("[") and stripped.endswith("]")
-        ):
-            # But exclude AppleScript record format (unquoted keys with colons)
-            if ":" in stripped and '"' not in stripped.split(":")[0]:
-                return False  # This looks like AppleScript record format
-            return True
+        first = stripped[:1]
+        if first == "{":
+            if not self.OBJECT_START.match(stripped):
+                return None
+        elif first != "[":
+            return None
 
-        return False
+        try:
+            return (_json_loads(stripped),)
+        except json.JSONDecodeError:
+            return None
 
-    def parse(self, raw_output: str) -> Union[Dict, List]:
+    def parse(
+        self, raw_output: str, context: Optional[tuple] = None
+    ) -> Union[Dict, List]:
         """Parse JSON output."""
+        # The value decoded by can_parse is reused when the chain passes it on
+        if context:
+            return context[0]
+
         try:
-            return json.loads(raw_output)
+            return _json_loads(raw_output)
         except json.JSONDecodeError as e:
             raise AppleScriptParsingError(raw_output, "JSONParser", e)
 
@@ -81,35 +150,40 @@ class JSONParser(ParserStrategy):
 class PrimitiveParser(ParserStrategy):
     """Parser for primitive values (bool, int, float, string)."""
 
-    def can_parse(self, raw_output: str) -> bool:
-        """Primitive parser can handle any non-structured output."""
-        return True  # This is the fallback parser
+    def can_parse(
+        self, raw_output: str, stripped: Optional[str] = None
+    ) -> Union[str, bool]:
+        """
+        Primitive parser can handle any non-structured output.
+
+        Returns:
+            The stripped output when the caller supplied a non-empty one,
+            which parse reuses; True otherwise
+        """
+        return stripped or True  # This is the fallback parser
 
-    def parse(self, raw_output: str) -> Union[bool, int, float, str]:
+    def parse(
+        self, raw_output: str, context: Optional[str] = None
+    ) -> Optional[Union[bool, int, float, str]]:
         """Parse primitive values."""
         if not raw_output:
             return None
 
-        value = raw_output.strip()
+        value = context if isinstance(context, str) else raw_output.strip()
 
         # If it's just whitespace, return the original
         if not value and raw_output:
             return raw_output
 
         # Boolean values
-        if value.lower() == "true":
-            return True
-        elif value.lower() == "false":
-            return False
+        boolean = _parse_boolean(value)
+        if boolean is not None:
+            return boolean
 
         # Numeric values
-        try:
-            if "." in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            pass
+        number = _parse_number(value)
+        if number is not None:
+            return number
 
         # Default to string
         return value
@@ -118,193 +192,184 @@ class PrimitiveParser(ParserStrategy):
 class StructuredRecordParser(ParserStrategy):
     """Parser for AppleScript structured record format (from -s s flag)."""
 
-    def can_parse(self, raw_output: str) -> bool:
-        """Check if output is in structured record format."""
+    leading_chars = "{"
+
+    # Structural tokens of the record format, scanned in a single pass
+    TOKEN_PATTERN = re.compile(
+        r'(?P<string>"(?:[^"\\]|\\.)*")'
+        r"|(?P<open>[({])"
+        r"|(?P<close>[)}])"
+        r"|(?P<comma>,)"
+        r"|(?P<colon>:)",
+        re.DOTALL,
+    )
+
+    def can_parse(
+        self, raw_output: str, stripped: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Check if output is in structured record format.
+
+        Returns:
+            The stripped output, which parse reuses, or None
+        """
         if not raw_output:
-            return False
+            return None
 
-        stripped = raw_output.strip()
+        if stripped is None:
+            stripped = raw_output.strip()
         # Single record: {key:value, ...}
         # Multiple records: {{key:value, ...}, {key:value, ...}}
-        return (stripped.startswith("{{") and stripped.endswith("}}")) or (
+        if (stripped.startswith("{{") and stripped.endswith("}}")) or (
             stripped.startswith("{") and ":" in stripped and stripped.endswith("}")
-        )
+        ):
+            return stripped
+        return None
 
-    def parse(self, raw_output: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    def parse(
+        self, raw_output: str, context: Optional[str] = None
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Parse structured record format."""
-        stripped = raw_output.strip()
+        stripped = context or raw_output.strip()
 
         try:
             if stripped.startswith("{{") and stripped.endswith("}}"):
                 # Multiple records
                 return self._parse_multiple_records(stripped)
             else:
-                # Single record
-                return self._parse_single_record(stripped)
+                # Single record, without its outer braces
+                return self._parse_record(stripped, 1, len(stripped) - 1)
         except Exception as e:
             raise AppleScriptParsingError(raw_output, "StructuredRecordParser", e)
 
     def _parse_multiple_records(self, content: str) -> List[Dict[str, Any]]:
-        """Parse multiple structured records."""
-        import re
-        
-        # Remove outer braces {{ and }}
-        inner = content[2:-2]
-
-        # Split on "}, {" pattern - this is simpler and more reliable 
-        # than complex depth tracking for AppleScript structured format
-        parts = re.split(r'\}, \{', inner)
-        
-        records = []
-        for i, part in enumerate(parts):
-            # Add back the braces that were removed by splitting
-            if i == 0:
-                # First record: add closing brace
-                record = part + "}"
-            elif i == len(parts) - 1:
-                # Last record: add opening brace  
-                record = "{" + part
-            else:
-                # Middle records: add both braces
-                record = "{" + part + "}"
-                
-            records.append(record)
-
-        # Parse each record
-        parsed_records = []
-        for record in records:
-            if record.strip():
-                parsed_records.append(self._parse_single_record(record))
-
-        return parsed_records
-
-    def _parse_single_record(self, record_str: str) -> Dict[str, Any]:
-        """Parse a single structured record."""
-        result = {}
-
-        # Remove outer braces
-        content = record_str.strip()[1:-1]
-
-        # Split into key-value pairs
-        pairs = self._split_pairs(content)
-
-        for pair in pairs:
-            key, value = self._parse_pair(pair)
-            if key:
-                result[key] = value
-
-        return result
+        """
+        Parse multiple structured records.
 
-    def _split_pairs(self, content: str) -> List[str]:
-        """Split record content into key-value pairs."""
-        pairs = []
-        current_pair = ""
+        The records of the outer list are split into pairs in the same scan
+        that finds them, so each character of the output is scanned once.
+        """
+        records: List[Dict[str, Any]] = []
+        record: Dict[str, Any] = {}
+        pair_start = 0
+        separator = -1
         depth = 0
-        in_string = False
-        escape_next = False
-
-        for char in content:
-            if escape_next:
-                escape_next = False
-                current_pair += char
-                continue
 
-            if char == "\\":
-                escape_next = True
-                current_pair += char
+        for match in self.TOKEN_PATTERN.finditer(content, 1, len(content) - 1):
+            kind = match.lastgroup
+            if kind == "open":
+                depth += 1
+                if depth == 1:
+                    record = {}
+                    pair_start = match.end()
+                    separator = -1
+            elif kind == "close":
+                depth -= 1
+                if depth == 0:
+                    self._add_pair(
+                        record, content, pair_start, separator, match.start()
+                    )
+                    records.append(record)
+            elif depth != 1:
                 continue
+            elif kind == "colon":
+                if separator == -1:
+                    separator = match.start()
+            elif kind == "comma":
+                self._add_pair(record, content, pair_start, separator, match.start())
+                pair_start = match.end()
+                separator = -1
 
-            if char == '"':
-                in_string = not in_string
-            elif not in_string:
-                if char in "({":
-                    depth += 1
-                elif char in ")}":
-                    depth -= 1
-                elif char == "," and depth == 0:
-                    pairs.append(current_pair.strip())
-                    current_pair = ""
-                    continue
+        return records
 
-            current_pair += char
-
-        if current_pair.strip():
-            pairs.append(current_pair.strip())
-
-        return pairs
-
-    def _parse_pair(self, pair: str) -> tuple[str, Any]:
-        """Parse a key-value pair."""
-        # Find the key-value separator
-        colon_pos = self._find_separator(pair)
-        if colon_pos == -1:
-            return None, None
-
-        key = pair[:colon_pos].strip()
-        value_str = pair[colon_pos + 1 :].strip()
+    def _parse_record(self, text: str, start: int, end: int) -> Dict[str, Any]:
+        """
+        Parse the record whose content, without braces, is text[start:end].
 
-        # Parse the value
-        value = self._parse_value(value_str)
+        Pairs and their key separators are found in the same scan, and only
+        keys and values are sliced out of the text.
+        """
+        result: Dict[str, Any] = {}
 
-        return key, value
+        pair_start = start
+        separator = -1
+        depth = 0
+        for match in self.TOKEN_PATTERN.finditer(text, start, end):
+            kind = match.lastgroup
+            if kind == "open":
+                depth += 1
+            elif kind == "close":
+                depth -= 1
+            elif depth:
+                continue
+            elif kind == "colon":
+                if separator == -1:
+                    separator = match.start()
+            elif kind == "comma":
+                self._add_pair(result, text, pair_start, separator, match.start())
+                pair_start = match.end()
+                separator = -1
 
-    def _find_separator(self, pair: str) -> int:
-        """Find the colon that separates key from value."""
-        in_string = False
-        escape_next = False
+        self._add_pair(result, text, pair_start, separator, end)
 
-        for i, char in enumerate(pair):
-            if escape_next:
-                escape_next = False
-                continue
+        return result
 
-            if char == "\\":
-                escape_next = True
-                continue
+    def _add_pair(
+        self, result: Dict[str, Any], text: str, start: int, separator: int, end: int
+    ) -> None:
+        """Parse the pair text[start:end] into result, if it has a key."""
+        if separator == -1:
+            return
 
-            if char == '"':
-                in_string = not in_string
-            elif not in_string and char == ":":
-                return i
+        key = text[start:separator].strip()
+        if key:
+            # Every record of a listing repeats the same keys; interning
+            # lets them all share one string per key
+            result[sys.intern(key)] = self._parse_value(text[separator + 1 : end])
 
-        return -1
+    # First characters of the typed values; anything else is a plain string
+    BOOLEAN_CHARS = frozenset("tfTF")
+    NUMBER_CHARS = frozenset("0123456789+-.")
 
     def _parse_value(self, value_str: str) -> Any:
         """Parse a structured value string."""
         value_str = value_str.strip()
 
-        # Missing value
-        if value_str == "missing value":
-            return None
+        # Each value only runs the check its first character could match
+        first = value_str[:1]
+
+        # Quoted strings
+        if first == '"':
+            if value_str.endswith('"'):
+                return value_str[1:-1]
 
         # Boolean values
-        if value_str.lower() == "true":
-            return True
-        elif value_str.lower() == "false":
-            return False
+        elif first in self.BOOLEAN_CHARS:
+            boolean = _parse_boolean(value_str)
+            if boolean is not None:
+                return boolean
 
-        # Quoted strings
-        if value_str.startswith('"') and value_str.endswith('"'):
-            return value_str[1:-1]
+        # Missing value
+        elif first == "m":
+            if value_str == "missing value":
+                return None
 
         # Date values - handle various malformed date formats
-        if value_str.startswith('date "'):
-            if value_str.endswith('"}'):
-                return value_str[6:-2]  # Remove 'date "' and '"}'
-            elif value_str.endswith('"'):
-                return value_str[6:-1]  # Remove 'date "' and '"'
-            else:
-                # Missing closing quote - just remove 'date "'
-                return value_str[6:]
+        elif first == "d":
+            if value_str.startswith('date "'):
+                if value_str.endswith('"}'):
+                    return value_str[6:-2]  # Remove 'date "' and '"}'
+                elif value_str.endswith('"'):
+                    return value_str[6:-1]  # Remove 'date "' and '"'
+                else:
+                    # Missing closing quote - just remove 'date "'
+                    return value_str[6:]
 
         # Numeric values
-        try:
-            if "." in value_str:
-                return float(value_str)
-            else:
-                return int(value_str)
-        except ValueError:
-            pass
+        elif first in self.NUMBER_CHARS:
+            number = _parse_number(value_str)
+            if number is not None:
+                return number
 
         # Default to string
         return value_str
@@ -313,15 +378,22 @@ class StructuredRecordParser(ParserStrategy):
 class DateParser(ParserStrategy):
     """Specialized parser for AppleScript date format."""
 
+    leading_chars = "d"
+
     DATE_PATTERN = re.compile(r'^date "(.+)"$')
 
-    def can_parse(self, raw_output: str) -> bool:
-        """Check if output is an AppleScript date."""
-        return bool(self.DATE_PATTERN.match(raw_output.strip()))
+    def can_parse(
+        self, raw_output: str, stripped: Optional[str] = None
+    ) -> Optional[re.Match]:
+        """Check if output is an AppleScript date, returning the match."""
+        if stripped is None:
+            stripped = raw_output.strip()
+        return self.DATE_PATTERN.match(stripped)
 
-    def parse(self, raw_output: str) -> str:
+    def parse(self, raw_output: str, context: Optional[re.Match] = None) -> str:
         """Extract date string from AppleScript date format."""
-        match = self.DATE_PATTERN.match(raw_output.strip())
+        # The match found by can_parse is reused when the chain passes it on
+        match = context or self.DATE_PATTERN.match(raw_output.strip())
         if match:
             return match.group(1)
 
@@ -331,45 +403,61 @@ class DateParser(ParserStrategy):
 class ListParser(ParserStrategy):
     """Parser for AppleScript list format."""
 
-    def can_parse(self, raw_output: str) -> bool:
-        """Check if output is a simple AppleScript list."""
+    leading_chars = "{"
+
+    # Quoted items are matched whole, so only bare commas separate items
+    SPLIT_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|,', re.DOTALL)
+
+    def can_parse(
+        self, raw_output: str, stripped: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Check if output is a simple AppleScript list.
+
+        Returns:
+            The stripped output, which parse reuses, or None
+        """
         if not raw_output:
-            return False
+            return None
 
-        stripped = raw_output.strip()
+        if stripped is None:
+            stripped = raw_output.strip()
         # Simple list format: {item1, item2, item3}
-        return (
+        if (
             stripped.startswith("{")
             and stripped.endswith("}")
             and ":" not in stripped
             and not stripped.startswith("{{")
-        )
+        ):
+            return stripped
+        return None
 
-    def parse(self, raw_output: str) -> List[str]:
+    def parse(self, raw_output: str, context: Optional[str] = None) -> List[str]:
         """Parse simple AppleScript list."""
         # Remove outer braces
-        content = raw_output.strip()[1:-1]
+        content = (context or raw_output.strip())[1:-1]
 
         if not content:
             return []
 
-        # Split by comma (simple implementation for now)
-        items = []
-        current_item = ""
-        in_quotes = False
-
-        for char in content:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == "," and not in_quotes:
-                items.append(current_item.strip())
-                current_item = ""
-                continue
+        # Lists of IDs and other bare items split on every comma
+        if '"' not in content:
+            items = content.split(",")
+            if not items[-1]:
+                items.pop()
+            return [item.strip() for item in items]
 
-            current_item += char
+        # Split on commas outside quoted items, slicing rather than
+        # building each item a character at a time
+        items = []
+        start = 0
+        for match in self.SPLIT_PATTERN.finditer(content):
+            if match.group() == ",":
+                items.append(content[start : match.start()].strip())
+                start = match.end()
 
-        if current_item:
-            items.append(current_item.strip())
+        if content[start:]:
+            items.append(content[start:].strip())
 
         # Clean up quoted items
         cleaned_items = []
@@ -382,6 +470,16 @@ class ListParser(ParserStrategy):
         return cleaned_items
 
 
+# Parsers hold no per-parse state, so every default chain shares one set
+_DEFAULT_PARSERS = (
+    JSONParser(),
+    StructuredRecordParser(),
+    DateParser(),
+    ListParser(),
+    PrimitiveParser(),  # Fallback parser
+)
+
+
 class ParserChain:
     """
     Chain of responsibility for parsing AppleScript output.
@@ -389,6 +487,12 @@ class ParserChain:
     Tries each parser in order until one can handle the output.
     """
 
+    # Short outputs recur often ("missing value", "true", tag names), so
+    # their immutable results are remembered
+    PARSE_CACHE_SIZE = 1024
+    PARSE_CACHE_MAX_LENGTH = 256
+    CACHEABLE_TYPES = (type(None), bool, int, float, str)
+
     def __init__(self, parsers: Optional[List[ParserStrategy]] = None):
         """
         Initialize the parser chain.
@@ -396,17 +500,49 @@ class ParserChain:
         Args:
             parsers: List of parsers to try in order
         """
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.parsers = parsers or self._default_parsers()
 
+    @property
+    def parsers(self) -> Tuple[ParserStrategy, ...]:
+        """
+        The parsers tried in order.
+
+        This is a tuple, as the chain dispatches through tables built from
+        it; assign a new sequence to change the parsers.
+        """
+        return self._parsers
+
+    @parsers.setter
+    def parsers(self, parsers: List[ParserStrategy]) -> None:
+        self._parsers = tuple(parsers)
+
+        # Candidate parsers by first character of the output, in chain
+        # order, held as bound (can_parse, parse) pairs
+        fallback = [
+            (p.can_parse, p.parse) for p in self._parsers if p.leading_chars is None
+        ]
+        dispatch: Dict[str, List[Tuple[Callable, Callable]]] = {}
+        for parser in self._parsers:
+            for char in parser.leading_chars or "":
+                dispatch.setdefault(char, [])
+        for char, candidates in dispatch.items():
+            candidates.extend(
+                (p.can_parse, p.parse)
+                for p in self._parsers
+                if p.leading_chars is None or char in p.leading_chars
+            )
+        self._fallback = fallback
+        self._dispatch = dispatch
+
+        # Results from the previous parsers no longer apply
+        with self._cache_lock:
+            self._cache.clear()
+
     def _default_parsers(self) -> List[ParserStrategy]:
         """Get default parser chain."""
-        return [
-            JSONParser(),
-            StructuredRecordParser(),
-            DateParser(),
-            ListParser(),
-            PrimitiveParser(),  # Fallback parser
-        ]
+        return list(_DEFAULT_PARSERS)
 
     def parse(self, raw_output: str) -> Any:
         """
@@ -424,10 +560,39 @@ class ParserChain:
         if not raw_output:
             return None
 
-        for parser in self.parsers:
-            if parser.can_parse(raw_output):
-                logger.debug(f"Using {parser.__class__.__name__} to parse output")
-                return parser.parse(raw_output)
+        if len(raw_output) > self.PARSE_CACHE_MAX_LENGTH:
+            return self._parse_uncached(raw_output)
+
+        with self._cache_lock:
+            if raw_output in self._cache:
+                self._cache.move_to_end(raw_output)
+                return self._cache[raw_output]
+
+        result = self._parse_uncached(raw_output)
+
+        # Dicts and lists are left out, as callers may modify them
+        if type(result) in self.CACHEABLE_TYPES:
+            with self._cache_lock:
+                self._cache[raw_output] = result
+                while len(self._cache) > self.PARSE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return result
+
+    def _parse_uncached(self, raw_output: str) -> Any:
+        """Parse non-empty raw output without consulting the cache."""
+        # Stripped once and shared by every parser's format check; only
+        # parsers that accept the leading character are asked
+        stripped = raw_output.strip()
+        for can_parse, parse in self._dispatch.get(stripped[:1], self._fallback):
+            context = can_parse(raw_output, stripped)
+            if context:
+                logger.debug(
+                    "Using %s to parse output", type(parse.__self__).__name__
+                )
+                if context is True:
+                    return parse(raw_output)
+                return parse(raw_output, context)
 
         # This should never happen with PrimitiveParser as fallback
         raise AppleScriptParsingError(
@@ -0,0 +1,134 @@
+"""
+Unit tests for AppleScript converters.
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from enum import Enum
+from unittest.mock import Mock, patch
+
+from applescript.converters import (
+    AppleScriptReferenceConverter,
+    PythonToAppleScriptConverter,
+)
+
+
+class TestPythonToAppleScriptConverter:
+    """Test cases for PythonToAppleScriptConverter."""
+
+    @pytest.fixture
+    def converter(self) -> PythonToAppleScriptConverter:
+        return PythonToAppleScriptConverter()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "current date",
+            " (current date) ",
+            "(current date) + (3 * days)",
+            "(current date) - (1 * days)",
+            'area id "ABC"',
+            'project "Work"',
+            'to do id "XYZ"',
+            'list "Today"',
+            "missing value",
+            "true",
+        ],
+    )
+    def test_expressions_are_not_quoted(
+        self, converter: PythonToAppleScriptConverter, value: str
+    ) -> None:
+        """Test that AppleScript expressions are passed through unquoted."""
+        assert converter.convert(value) == value
+
+    @pytest.mark.parametrize(
+        "value",
+        ["Buy milk", "area", "area   ", "to do something", "(current date) later", "True"],
+    )
+    def test_plain_strings_are_quoted(
+        self, converter: PythonToAppleScriptConverter, value: str
+    ) -> None:
+        """Test that ordinary strings are quoted."""
+        assert converter.convert(value) == f'"{value}"'
+
+    def test_convert_by_type(self, converter: PythonToAppleScriptConverter) -> None:
+        """Test conversion of exact types and of subclasses."""
+        class Color(str, Enum):
+            RED = "red"
+
+        assert converter.convert(None) == "missing value"
+        assert converter.convert(True) == "true"
+        assert converter.convert(3) == "3"
+        assert converter.convert(1.5) == "1.5"
+        assert converter.convert(Color.RED) == '"red"'
+        assert converter.convert(["a", False]) == '{"a", false}'
+
+    def test_quotes_and_backslashes_are_escaped(
+        self, converter: PythonToAppleScriptConverter
+    ) -> None:
+        """Test escaping of quotes and backslashes inside strings."""
+        assert converter.convert('say "hi"') == '"say \\"hi\\""'
+        assert converter.convert("C:\\temp") == '"C:\\\\temp"'
+
+    def test_short_strings_converted_once(
+        self, converter: PythonToAppleScriptConverter
+    ) -> None:
+        """Test that repeated short strings reuse their conversion."""
+        short = 'Shared "project" name'
+        long = "x" * (converter.STRING_CACHE_MAX_LENGTH + 1)
+        pattern = Mock(wraps=PythonToAppleScriptConverter.EXPRESSION_PATTERN)
+
+        with patch.object(PythonToAppleScriptConverter, "EXPRESSION_PATTERN", pattern):
+            assert converter.convert([short, short]) == (
+                '{"Shared \\"project\\" name", "Shared \\"project\\" name"}'
+            )
+            assert converter.convert(long) == f'"{long}"'
+            assert converter.convert(long) == f'"{long}"'
+
+        assert pattern.match.call_count == 3
+
+    def test_today_looked_up_once_per_conversion(
+        self, converter: PythonToAppleScriptConverter
+    ) -> None:
+        """Test that several dates in one value share a single clock read."""
+        today = date.today()
+        value = {"due": today, "start": today + timedelta(days=2), "tags": [today]}
+
+        calls = []
+
+        class CountingDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                calls.append(tz)
+                return super().now(tz)
+
+        with patch("applescript.converters.datetime", CountingDatetime):
+            result = converter.convert(value)
+
+        assert result == (
+            "{due:current date, start:(current date) + (2 * days), tags:{current date}}"
+        )
+        assert len(calls) == 1
+
+
+class TestAppleScriptReferenceConverter:
+    """Test cases for AppleScriptReferenceConverter."""
+
+    @pytest.fixture
+    def converter(self) -> AppleScriptReferenceConverter:
+        return AppleScriptReferenceConverter()
+
+    def test_is_reference(self, converter: AppleScriptReferenceConverter) -> None:
+        """Test reference detection."""
+        assert converter.is_reference('project id "ABC"')
+        assert converter.is_reference('to do "Buy milk"')
+        assert converter.is_reference("list Today")
+        assert not converter.is_reference("projects")
+        assert not converter.is_reference(None)
+
+    def test_parse_reference(self, converter: AppleScriptReferenceConverter) -> None:
+        """Test parsing references by ID and by name."""
+        assert converter.parse_reference('area id "XYZ"') == ("area", "XYZ", True)
+        assert converter.parse_reference('tag "Work"') == ("tag", "Work", False)
+        assert converter.parse_reference("area id XYZ") == (None, None, None)
+        assert converter.parse_reference('project "') == (None, None, None)
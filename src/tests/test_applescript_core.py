@@ -3,12 +3,17 @@ Unit tests for AppleScript core engine.
 """
 
 import pytest
+import re
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
-from applescript.core import AppleScriptEngine
+from applescript.core import AppleScriptEngine, AppleScriptHost
 from applescript.errors import (
+    AppleScriptBatchError,
     AppleScriptExecutionError,
     AppleScriptTimeoutError,
 )
@@ -47,11 +52,10 @@ class TestAppleScriptEngine:
         assert result == "test output"
         mock_run.assert_called_once()
 
-        # Verify command structure
+        # Verify command structure; the script is sent on stdin
         call_args = mock_run.call_args[0][0]
-        assert call_args[0] == "osascript"
-        assert "-e" in call_args
-        assert 'display dialog "test"' in call_args
+        assert call_args == ["osascript", "-"]
+        assert mock_run.call_args[1]["input"] == 'display dialog "test"'
 
     @patch("subprocess.run")
     def test_execute_with_flags(
@@ -158,3 +162,258 @@ class TestAppleScriptEngine:
         # Verify timeout was passed to subprocess.run
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs["timeout"] == custom_timeout
+
+    @patch("subprocess.run")
+    def test_execute_decodes_output_as_utf8(
+        self, mock_run: MagicMock, engine: AppleScriptEngine
+    ) -> None:
+        """Test that output is decoded as UTF-8 regardless of the locale."""
+        mock_run.return_value = MagicMock(stdout="Café ✓\n", stderr="", returncode=0)
+
+        assert engine.execute("get name") == "Café ✓"
+        assert mock_run.call_args[1]["encoding"] == "utf-8"
+
+    def test_execute_compiled_caches_script(self, tmp_path: Path) -> None:
+        """Test that a script is compiled once and then run from the cache."""
+        engine = AppleScriptEngine(cache_dir=tmp_path)
+
+        def fake_run(cmd, **kwargs):
+            if cmd[0] == "osacompile":
+                Path(cmd[2]).write_bytes(b"compiled")
+            return MagicMock(stdout="output\n", stderr="", returncode=0)
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            source = "on run argv\n    return item 1 of argv\nend run"
+            assert engine.execute_compiled("echo", source, args=["a"]) == "output"
+            assert engine.execute_compiled("echo", source, args=["b"]) == "output"
+
+        commands = [call[0][0] for call in mock_run.call_args_list]
+        assert [cmd[0] for cmd in commands] == ["osacompile", "osascript", "osascript"]
+        assert commands[1][-1] == "a"
+        assert commands[2][-1] == "b"
+
+        # Compiled to a temporary file, then moved into place
+        (script_path,) = tmp_path.iterdir()
+        assert commands[1][1] == str(script_path)
+        assert commands[0][2] != str(script_path)
+
+    def test_compiles_once_for_concurrent_callers(self, tmp_path: Path) -> None:
+        """Test that threads first running the same script share one compile."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir(mode=0o777)
+        cache_dir.chmod(0o777)
+        engine = AppleScriptEngine(cache_dir=cache_dir)
+        compiles = []
+
+        def fake_run(cmd, **kwargs):
+            if cmd[0] == "osacompile":
+                compiles.append(cmd)
+                time.sleep(0.05)
+                Path(cmd[2]).write_bytes(b"compiled")
+            return MagicMock(stdout="output\n", stderr="", returncode=0)
+
+        with patch("subprocess.run", side_effect=fake_run):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: engine.execute_compiled("same", "return 1"), range(4)
+                    )
+                )
+
+        assert results == ["output"] * 4
+        assert len(compiles) == 1
+        assert [path.name for path in cache_dir.iterdir()] == [
+            Path(compiles[0][2]).name.split("-", 1)[1]
+        ]
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+    @patch("subprocess.run")
+    def test_execute_compiled_compile_error(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test compilation error handling."""
+        engine = AppleScriptEngine(cache_dir=tmp_path)
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, ["osacompile"], stderr="Syntax error"
+        )
+
+        with pytest.raises(AppleScriptExecutionError) as exc_info:
+            engine.execute_compiled("bad", "not valid applescript")
+
+        assert exc_info.value.stderr == "Syntax error"
+
+
+# Stand-in for the osascript host that speaks the same framing protocol:
+# echoes the script (or a compiled file's path and arguments), fails on
+# "fail" and hangs on "hang".
+FAKE_HOST = r"""
+import json, sys, time
+marker = "\n" + sys.argv[1] + "\n"
+buffer = ""
+while True:
+    data = sys.stdin.buffer.read1(65536).decode()
+    if not data:
+        break
+    buffer += data
+    while marker in buffer:
+        request, buffer = buffer.split(marker, 1)
+        mode, script = request.split("\n", 1)
+        if " " in mode:
+            mode, args = mode.split(" ", 1)
+            script = "file " + script + " " + ",".join(json.loads(args))
+        if script == "fail":
+            reply = "error -1728\nCan't get to do id \"x\"."
+        elif script == "hang":
+            time.sleep(60)
+            reply = "ok\n"
+        else:
+            reply = "ok\n" + mode + ":" + script + "\n"
+        sys.stdout.write(reply + marker)
+        sys.stdout.flush()
+"""
+
+
+class TestAppleScriptBatch:
+    """Test cases for batched script execution."""
+
+    @staticmethod
+    def fake_batch_run(replies: list):
+        """Build a subprocess.run stand-in that answers with the given replies."""
+        def run(cmd, **kwargs):
+            separator = re.search(
+                r"__APPLESCRIPT_BATCH_\w+?__", kwargs["input"]
+            ).group(0)
+            stdout = "".join(f"{separator}{reply}" for reply in replies)
+            return MagicMock(stdout=stdout + "\n")
+
+        return run
+
+    def test_execute_batch_single_process(self) -> None:
+        """Test that all scripts run in one osascript invocation."""
+        engine = AppleScriptEngine()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = self.fake_batch_run(["ok\nABC", "ok\n"])
+            result = engine.execute_batch(
+                ['tell application "Things3"\n    make new to do\nend tell', "delete x"]
+            )
+
+        assert result == ["ABC", ""]
+        mock_run.assert_called_once()
+        script = mock_run.call_args[1]["input"]
+        assert "script batchScript0\ntell application \"Things3\"" in script
+        assert "run batchScript1" in script
+
+    def test_execute_batch_keeps_multiline_strings(self) -> None:
+        """Test that scripts are batched unchanged, including multiline notes."""
+        engine = AppleScriptEngine()
+        note_script = 'make new to do with properties {notes:"line1\nline2\r\x0cend"}'
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = self.fake_batch_run(["ok\nABC"])
+            engine.execute_batch([note_script])
+
+        script = mock_run.call_args[1]["input"]
+        assert f"script batchScript0\n{note_script}\nend script" in script
+
+    def test_execute_batch_error(self) -> None:
+        """Test that a failing script in the batch raises with its error number."""
+        engine = AppleScriptEngine()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = self.fake_batch_run(
+                ["ok\nABC", "error -1728\nCan't get to do id \"x\"."]
+            )
+            with pytest.raises(AppleScriptExecutionError) as exc_info:
+                engine.execute_batch(["first", "second"])
+
+        assert isinstance(exc_info.value, AppleScriptBatchError)
+        assert exc_info.value.returncode == -1728
+        assert exc_info.value.script == "second"
+        assert exc_info.value.results == ["ABC", None]
+
+    def test_execute_batch_empty(self) -> None:
+        """Test that an empty batch doesn't run osascript."""
+        with patch("subprocess.run") as mock_run:
+            assert AppleScriptEngine().execute_batch([]) == []
+        mock_run.assert_not_called()
+
+
+class TestAppleScriptHost:
+    """Test cases for the persistent AppleScript host."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create a persistent engine backed by the fake host."""
+        def fake_command(host: AppleScriptHost) -> list:
+            return [sys.executable, "-c", FAKE_HOST, host._sentinel]
+
+        with patch.object(AppleScriptHost, "_command", fake_command):
+            engine = AppleScriptEngine(persistent=True)
+            yield engine
+            engine._host.close()
+
+    def test_reuses_single_process(self, engine: AppleScriptEngine) -> None:
+        """Test that consecutive scripts run in the same host process."""
+        assert engine.execute("first") == "h:first"
+        proc = engine._host._proc
+        assert engine.execute_structured('tell app "X"\n    get name\nend tell') == (
+            's:tell app "X"\n    get name\nend tell'
+        )
+        assert engine._host._proc is proc
+
+    def test_execution_error(self, engine: AppleScriptEngine) -> None:
+        """Test that script errors are raised with the AppleScript error number."""
+        with pytest.raises(AppleScriptExecutionError) as exc_info:
+            engine.execute("fail")
+
+        assert exc_info.value.returncode == -1728
+        assert "Can't get to do id" in str(exc_info.value)
+        assert engine.execute("after") == "h:after"
+
+    def test_timeout_restarts_host(self, engine: AppleScriptEngine) -> None:
+        """Test that a hung host is killed and replaced on the next call."""
+        with pytest.raises(AppleScriptTimeoutError):
+            engine.execute("hang", timeout=0.5)
+
+        assert engine._host._proc is None
+        assert engine.execute("again") == "h:again"
+
+    def test_compiled_scripts_run_in_host(
+        self, engine: AppleScriptEngine, tmp_path: Path
+    ) -> None:
+        """Test that compiled scripts run in the host rather than a new process."""
+        engine.cache_dir = tmp_path
+
+        def fake_run(cmd, **kwargs):
+            assert cmd[0] == "osacompile"
+            Path(cmd[2]).write_bytes(b"compiled")
+            return MagicMock(stdout="", stderr="", returncode=0)
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            source = "on run argv\n    return item 1 of argv\nend run"
+            first = engine.execute_compiled("echo", source, args=['say "hi"'])
+            second = engine.execute_compiled(
+                "echo", source, args=["b", "c"], flags=["-s", "s"]
+            )
+
+        (script_path,) = tmp_path.iterdir()
+        mock_run.assert_called_once()
+        assert first == f'h:file {script_path} say "hi"'
+        assert second == f"s:file {script_path} b,c"
+
+    def test_falls_back_when_host_unavailable(self) -> None:
+        """Test that scripts run through one-shot osascript if the host can't start."""
+        def missing_command(host: AppleScriptHost) -> list:
+            return ["/nonexistent/osascript-host"]
+
+        with patch.object(AppleScriptHost, "_command", missing_command):
+            engine = AppleScriptEngine(persistent=True)
+
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(stdout="fallback\n")
+                assert engine.execute("get name") == "fallback"
+
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0] == ["osascript", "-"]
+            assert mock_run.call_args[1]["input"] == "get name"
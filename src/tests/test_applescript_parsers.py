@@ -3,6 +3,8 @@ Unit tests for AppleScript parsers.
 """
 
 import pytest
+from unittest.mock import patch
+
 from applescript.parsers import (
     JSONParser,
     PrimitiveParser,
@@ -27,6 +29,19 @@ class TestJSONParser:
         assert parser.can_parse('  {"key": "value"}  ')
         assert not parser.can_parse("not json")
         assert not parser.can_parse("")
+        assert not parser.can_parse('{key:"value"}')
+        assert not parser.can_parse("{item1, item2}")
+
+    def test_applescript_output_skips_decoder(self, parser: JSONParser) -> None:
+        """Test that AppleScript records and lists are rejected before decoding."""
+        with patch("applescript.parsers._json_loads") as json_loads:
+            assert not parser.can_parse('{{name:"a"}, {name:"b"}}')
+            assert not parser.can_parse('{"a", "b"}')
+            assert not parser.can_parse("{name:\"x\"}")
+
+        json_loads.assert_not_called()
+        assert parser.can_parse("{}") == ({},)
+        assert parser.can_parse('{ "a\\"b" : 1}') == ({'a"b': 1},)
 
     def test_can_parse_array(self, parser: JSONParser) -> None:
         """Test JSON array detection."""
@@ -126,6 +141,52 @@ class TestStructuredRecordParser:
         assert result[0]["name"] == "first"
         assert result[1]["name"] == "second"
 
+    def test_parse_multiple_records_with_nesting(
+        self, parser: StructuredRecordParser
+    ) -> None:
+        """Test that braces and separators inside values don't split records."""
+        result = parser.parse(
+            '{{name:"a}, {b", tags:{"x", "y"}}, {name:"c:d", due:date "Friday, June 20, 2025"}}'
+        )
+
+        assert result == [
+            {"name": "a}, {b", "tags": '{"x", "y"}'},
+            {"name": "c:d", "due": "Friday, June 20, 2025"},
+        ]
+
+    def test_parse_multiple_records_with_nested_records(
+        self, parser: StructuredRecordParser
+    ) -> None:
+        """Test that pairs of nested records stay inside their value."""
+        result = parser.parse("{{meta:{a:1, b:2}, id:1}, {id:2}}")
+
+        assert result == [{"meta": "{a:1, b:2}", "id": 1}, {"id": 2}]
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ('"text"', "text"),
+            ("TRUE", True),
+            ("false", False),
+            ("missing value", None),
+            ('date "Friday, June 20, 2025"', "Friday, June 20, 2025"),
+            ("-3", -3),
+            (".5", 0.5),
+            ("done", "done"),
+            ("maybe", "maybe"),
+            ("tomorrow", "tomorrow"),
+            ("-", "-"),
+            ("", ""),
+        ],
+    )
+    def test_parse_value_by_first_char(
+        self, parser: StructuredRecordParser, value: str, expected
+    ) -> None:
+        """Test that values are typed by their first character, or kept as text."""
+        result = parser._parse_value(f" {value} ")
+        assert result == expected
+        assert type(result) is type(expected)
+
     def test_parse_missing_value(self, parser: StructuredRecordParser) -> None:
         """Test missing value parsing."""
         result = parser.parse('{name:"test", empty:missing value}')
@@ -136,6 +197,16 @@ class TestStructuredRecordParser:
         result = parser.parse('{message:"hello, world!"}')
         assert result["message"] == "hello, world!"
 
+    def test_parse_nested_and_escaped_values(
+        self, parser: StructuredRecordParser
+    ) -> None:
+        """Test that nested lists and escaped quotes don't split pairs."""
+        result = parser.parse(
+            '{notes:"say \\"hi, there\\"", items:{1, 2}, due:date "Friday, June 20, 2025"}'
+        )
+        assert list(result) == ["notes", "items", "due"]
+        assert result["due"] == "Friday, June 20, 2025"
+
 
 class TestDateParser:
     """Test cases for DateParser."""
@@ -155,6 +226,11 @@ class TestDateParser:
         result = parser.parse('date "Friday, June 20, 2025 at 20:24:30"')
         assert result == "Friday, June 20, 2025 at 20:24:30"
 
+    def test_parse_reuses_match(self, parser: DateParser) -> None:
+        """Test that parse reuses the match returned by can_parse."""
+        match = parser.can_parse('date "Friday, June 20, 2025"')
+        assert parser.parse("ignored", match) == "Friday, June 20, 2025"
+
     def test_parse_invalid_date(self, parser: DateParser) -> None:
         """Test invalid date format."""
         with pytest.raises(AppleScriptParsingError):
@@ -185,6 +261,11 @@ class TestListParser:
         result = parser.parse('{"hello world", "another item"}')
         assert result == ["hello world", "another item"]
 
+    def test_parse_quoted_commas(self, parser: ListParser) -> None:
+        """Test that commas inside quoted items don't split them."""
+        result = parser.parse('{"milk, eggs", plain, "say \\"hi, there\\""}')
+        assert result == ["milk, eggs", "plain", 'say \\"hi, there\\"']
+
     def test_parse_empty_list(self, parser: ListParser) -> None:
         """Test empty list parsing."""
         result = parser.parse("{}")
@@ -215,6 +296,11 @@ class TestParserChain:
         assert isinstance(result, dict)
         assert result["name"] == "test"
 
+    def test_parse_list(self, chain: ParserChain) -> None:
+        """Test that AppleScript lists are not taken for JSON."""
+        assert chain.parse('{"a", "b"}') == ["a", "b"]
+        assert chain.parse("{a, b}") == ["a", "b"]
+
     def test_parse_primitive(self, chain: ParserChain) -> None:
         """Test primitive parsing through chain."""
         assert chain.parse("true") is True
@@ -225,8 +311,63 @@ class TestParserChain:
         """Test empty value parsing."""
         assert chain.parse("") is None
 
+    def test_parse_strips_once(self) -> None:
+        """Test that parsers receive the output already stripped."""
+        seen = []
+
+        class RecordingParser(PrimitiveParser):
+            def can_parse(self, raw_output, stripped=None):
+                seen.append(stripped)
+                return True
+
+        assert ParserChain([RecordingParser()]).parse("  42\n") == 42
+        assert seen == ["42"]
+
+    def test_parse_dispatches_on_leading_char(self) -> None:
+        """Test that only parsers accepting the first character are asked."""
+        asked = []
+
+        class RecordingParser(StructuredRecordParser):
+            def can_parse(self, raw_output, stripped=None):
+                asked.append(raw_output)
+                return super().can_parse(raw_output, stripped)
+
+        chain = ParserChain([RecordingParser(), PrimitiveParser()])
+
+        assert chain.parse("42") == 42
+        assert asked == []
+        assert chain.parse(" {id:1}") == {"id": 1}
+        assert asked == [" {id:1}"]
+
+    def test_parse_caches_short_immutable_results(self) -> None:
+        """Test that short scalar outputs are parsed once."""
+        asked = []
+
+        class RecordingParser(PrimitiveParser):
+            def can_parse(self, raw_output, stripped=None):
+                asked.append(raw_output)
+                return True
+
+        chain = ParserChain([StructuredRecordParser(), RecordingParser()])
+
+        assert chain.parse("missing value") == "missing value"
+        assert chain.parse("missing value") == "missing value"
+        assert asked == ["missing value"]
+
+        first = chain.parse("{id:1}")
+        first["id"] = 2
+        assert chain.parse("{id:1}") == {"id": 1}
+
     def test_custom_parsers(self) -> None:
         """Test custom parser chain."""
         custom_chain = ParserChain([PrimitiveParser()])
         assert len(custom_chain.parsers) == 1
         assert isinstance(custom_chain.parsers[0], PrimitiveParser)
+
+    def test_replacing_parsers(self, chain: ParserChain) -> None:
+        """Test assigning new parsers rebuilds the dispatch."""
+        assert chain.parse('{"a": 1}') == {"a": 1}
+
+        chain.parsers = [PrimitiveParser()]
+        assert isinstance(chain.parsers, tuple)
+        assert chain.parse('{"a": 1}') == '{"a": 1}'
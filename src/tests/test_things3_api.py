@@ -7,12 +7,22 @@ without requiring actual Things 3 application access.
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from unittest.mock import Mock, patch
 
 from things3.things3_api import Things3API
-from applescript.errors import AppleScriptError
-from things3.models import Todo, Project, Area, Tag, Status, ClassType
+from applescript.errors import AppleScriptError, AppleScriptExecutionError
+from things3.models import (
+    Todo,
+    TodoCreate,
+    TodoUpdate,
+    Project,
+    Area,
+    Tag,
+    Status,
+    ClassType,
+)
 
 
 class TestThings3APIInit:
@@ -22,9 +32,15 @@ class TestThings3APIInit:
     def test_init_creates_orchestrator(self, mock_orchestrator_class):
         """Test that initialization creates orchestrator."""
         api = Things3API()
-        mock_orchestrator_class.assert_called_once_with()
+        mock_orchestrator_class.assert_called_once_with(persistent=False)
         assert api.orchestrator == mock_orchestrator_class.return_value
 
+    @patch("things3.things3_api.Things3Orchestrator")
+    def test_init_persistent(self, mock_orchestrator_class):
+        """Test that a persistent API uses a persistent orchestrator."""
+        Things3API(persistent=True)
+        mock_orchestrator_class.assert_called_once_with(persistent=True)
+
 
 class TestThings3APIHelperMethods:
     """Test helper methods for parsing and conversion."""
@@ -193,6 +209,25 @@ class TestThings3APITodoOperations:
         assert result[0].id == "test-todo-123"
         assert result[1].id == "test-todo-456"
 
+    def test_get_all_todos_with_limit(self, api_with_mock, sample_todo_props):
+        """Test limiting the number of todos fetched."""
+        api_with_mock.orchestrator.execute_command.return_value = [sample_todo_props]
+
+        result = api_with_mock.get_all_todos(limit=1)
+        assert len(result) == 1
+
+        command = api_with_mock.orchestrator.execute_command.call_args[0][0]
+        assert "get properties of to dos 1 thru 1" in command
+        assert "if (count of to dos) > 1 then" in command
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_get_all_todos_invalid_limit(self, api_with_mock, limit):
+        """Test that a limit below 1 is rejected before running AppleScript."""
+        with pytest.raises(ValueError):
+            api_with_mock.get_all_todos(limit=limit)
+
+        api_with_mock.orchestrator.execute_command.assert_not_called()
+
     @pytest.mark.parametrize(
         "list_name", ["Inbox", "Today", "Upcoming", "Anytime", "Someday", "Logbook"]
     )
@@ -454,6 +489,188 @@ class TestThings3APITagOperations:
         )
 
 
+class TestThings3APIBulkOperations:
+    """Test bulk read operations."""
+
+    @pytest.fixture
+    def api_with_mock(self):
+        """Create API with mocked orchestrator."""
+        with patch("things3.things3_api.Things3Orchestrator"):
+            api = Things3API()
+            api.orchestrator = Mock()
+            return api
+
+    @pytest.fixture
+    def sample_project_props(self):
+        """Sample project properties from AppleScript."""
+        return {
+            "id": "project-123",
+            "name": "Test Project",
+            "creation date": "Thursday, June 19, 2025 at 10:00:00",
+            "class": "project",
+        }
+
+    @pytest.fixture
+    def sample_area_props(self):
+        """Sample area properties from AppleScript."""
+        return {"id": "area-123", "name": "Test Area", "class": "area"}
+
+    def test_prefetch_single_round_trip(
+        self, api_with_mock, sample_project_props, sample_area_props
+    ):
+        """Test that projects and areas are fetched in one orchestrator call."""
+        api_with_mock.orchestrator.get_properties_batch.return_value = [
+            sample_project_props,
+            sample_area_props,
+        ]
+
+        result = api_with_mock.prefetch(
+            project_ids=["project-123", "project-123"], area_ids=["area-123"]
+        )
+
+        api_with_mock.orchestrator.get_properties_batch.assert_called_once_with(
+            ['project id "project-123"', 'area id "area-123"']
+        )
+        assert result["todos"] == {}
+        assert isinstance(result["projects"]["project-123"], Project)
+        assert isinstance(result["areas"]["area-123"], Area)
+        assert result["areas"]["area-123"].name == "Test Area"
+
+    def test_prefetch_skips_missing_objects(
+        self, sample_project_props, sample_area_props
+    ):
+        """Test that a missing object, which fails the batched read, is left out."""
+        api = Things3API()
+        records = {
+            'project id "project-123"': sample_project_props,
+            'area id "area-123"': sample_area_props,
+        }
+
+        def execute_command(command):
+            script = command.build()
+            # Like AppleScript, one missing object fails the whole list
+            if 'to do id "todo-404"' in script:
+                raise AppleScriptExecutionError(
+                    "AppleScript execution failed",
+                    'Things3 got an error: Can’t get to do id "todo-404". (-1728)',
+                    1,
+                    script,
+                )
+            return [props for ref, props in records.items() if ref in script]
+
+        with patch.object(
+            api.orchestrator, "execute_command", side_effect=execute_command
+        ):
+            result = api.prefetch(
+                todo_ids=["todo-404"],
+                project_ids=["project-123"],
+                area_ids=["area-123"],
+            )
+
+        assert result["todos"] == {}
+        assert list(result["projects"]) == ["project-123"]
+        assert list(result["areas"]) == ["area-123"]
+
+    def test_prefetch_empty(self, api_with_mock):
+        """Test prefetching nothing."""
+        api_with_mock.orchestrator.get_properties_batch.return_value = []
+
+        result = api_with_mock.prefetch()
+        assert result == {"todos": {}, "projects": {}, "areas": {}}
+
+    def test_get_projects_by_ids(self, api_with_mock, sample_project_props):
+        """Test getting several projects by ID."""
+        api_with_mock.orchestrator.get_properties_batch.return_value = [
+            sample_project_props
+        ]
+
+        result = api_with_mock.get_projects_by_ids(["project-123"])
+        assert list(result) == ["project-123"]
+        assert result["project-123"].name == "Test Project"
+
+    def test_get_areas_by_ids(self, api_with_mock, sample_area_props):
+        """Test getting several areas by ID."""
+        api_with_mock.orchestrator.get_properties_batch.return_value = [
+            sample_area_props
+        ]
+
+        result = api_with_mock.get_areas_by_ids(["area-123"])
+        assert list(result) == ["area-123"]
+        api_with_mock.orchestrator.get_properties_batch.assert_called_once_with(
+            ['area id "area-123"']
+        )
+
+    def test_create_todos_two_round_trips(self, api_with_mock):
+        """Test that todos are created in one run and read back in another."""
+        api_with_mock.orchestrator.create_todos.return_value = ["todo-1", "todo-2"]
+        created = "Thursday, June 19, 2025 at 10:00:00"
+        api_with_mock.orchestrator.get_properties_batch.return_value = [
+            {"id": "todo-1", "name": "First", "creation date": created},
+            {"id": "todo-2", "name": "Second", "creation date": created},
+        ]
+
+        result = api_with_mock.create_todos(
+            [TodoCreate(name="First"), TodoCreate(name="Second", tags=["x"])]
+        )
+
+        data_list = api_with_mock.orchestrator.create_todos.call_args.args[0]
+        assert data_list[0]["name"] == "First"
+        assert data_list[1]["tags"] == ["x"]
+        api_with_mock.orchestrator.get_properties_batch.assert_called_once()
+        assert [todo.name for todo in result] == ["First", "Second"]
+
+    def test_update_todo_sends_only_set_fields(self, api_with_mock):
+        """Test that updates carry explicitly set fields, including None."""
+        api_with_mock.orchestrator.update_todo.return_value = "todo-1"
+        api_with_mock.get_todo = Mock(return_value="updated")
+
+        api_with_mock.update_todo("todo-1", TodoUpdate(name="New", area=None))
+
+        api_with_mock.orchestrator.update_todo.assert_called_once_with(
+            "todo-1", {"name": "New", "area": None}
+        )
+
+    def test_batched_lookups_coalesce(
+        self, sample_project_props, sample_area_props
+    ):
+        """Test that concurrent lookups are fetched in one orchestrator call."""
+        with patch("things3.things3_api.Things3Orchestrator"):
+            api = Things3API(batch_window=0.2)
+        api.orchestrator = Mock()
+        api.orchestrator.get_properties_batch.return_value = [
+            sample_project_props,
+            sample_area_props,
+        ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            project = executor.submit(api.get_project, "project-123")
+            area = executor.submit(api.get_area, "area-123")
+
+        assert project.result().name == "Test Project"
+        assert area.result().name == "Test Area"
+        api.orchestrator.get_properties_batch.assert_called_once()
+
+    def test_batched_lookup_not_found(self, sample_project_props):
+        """Test that a missing object doesn't fail the rest of its batch."""
+        with patch("things3.things3_api.Things3Orchestrator"):
+            api = Things3API(batch_window=0.2)
+        api.orchestrator = Mock()
+
+        def get_properties_batch(references):
+            if 'project id "missing"' in references:
+                raise AppleScriptError("Can't get project id \"missing\"")
+            return [sample_project_props]
+
+        api.orchestrator.get_properties_batch.side_effect = get_properties_batch
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            found = executor.submit(api.get_project, "project-123")
+            missing = executor.submit(api.get_project, "missing")
+
+        assert found.result().id == "project-123"
+        assert missing.result() is None
+
+
 class TestThings3APIParsingMethods:
     """Test parsing methods for different entity types."""
 
@@ -0,0 +1,62 @@
+"""
+Unit tests for Things 3 command builders.
+"""
+
+import pytest
+from datetime import date, timedelta
+
+from applescript.builders import AppleScriptCommand
+from things3.command_builders import TodoCommandBuilder
+
+
+class TestTodoCommandBuilder:
+    """Test cases for TodoCommandBuilder."""
+
+    @pytest.fixture
+    def builder(self) -> TodoCommandBuilder:
+        return TodoCommandBuilder()
+
+    def test_name_references_are_escaped(self, builder: TodoCommandBuilder) -> None:
+        """Test that quotes in project and area names can't break the script."""
+        script = builder.update_todo(
+            "ABC", {"project": 'Say "hi"', "area": "list of things"}
+        ).build()
+
+        assert 'move to do id "ABC" to project "Say \\"hi\\""' in script
+        assert 'to area "list of things"' in script
+
+    def test_id_references_are_kept(self, builder: TodoCommandBuilder) -> None:
+        """Test that ID references pass through unchanged."""
+        script = builder.update_todo("ABC", {"project": 'project id "XYZ"'}).build()
+
+        assert 'to project id "XYZ"' in script
+
+    def test_due_date_formats(self, builder: TodoCommandBuilder) -> None:
+        """Test keyword, ISO string and date due dates."""
+        in_two_days = date.today() + timedelta(days=2)
+
+        assert builder._format_date("Today") == "today"
+        assert builder._format_date(in_two_days) == "(current date) + (2 * days)"
+        assert (
+            builder._format_date(in_two_days.isoformat())
+            == "(current date) + (2 * days)"
+        )
+        with pytest.raises(ValueError):
+            builder._format_date("next week")
+
+
+class TestAppleScriptCommand:
+    """Test cases for AppleScriptCommand."""
+
+    def test_run_handler_keeps_multiline_strings(self) -> None:
+        """Test that wrapping in a run handler doesn't indent string contents."""
+        script = (
+            AppleScriptCommand()
+            .tell("Things3")
+            .add_command('set x to "line1\nline2"')
+            .with_argv()
+            .build()
+        )
+
+        assert '"line1\nline2"' in script
+        assert script.startswith("on run argv\n")
@@ -0,0 +1,181 @@
+"""
+Unit tests for the Things 3 orchestrator.
+
+The AppleScript engine is mocked, so no scripts are actually run.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from applescript.errors import AppleScriptBatchError, AppleScriptExecutionError
+from things3.orchestrator import Things3Orchestrator
+
+
+class TestThings3OrchestratorScriptCache:
+    """Test reuse of built todo scripts."""
+
+    @pytest.fixture
+    def orchestrator(self) -> Things3Orchestrator:
+        orchestrator = Things3Orchestrator()
+        orchestrator.engine = Mock()
+        orchestrator.engine.execute.return_value = "ABC"
+        return orchestrator
+
+    def test_repeated_payload_is_built_once(
+        self, orchestrator: Things3Orchestrator
+    ) -> None:
+        """Test that an identical create payload reuses its script."""
+        data = {"name": "Buy milk", "tags": ["errand"], "when": "today"}
+
+        with patch.object(
+            orchestrator.todo_builder,
+            "create_todo",
+            wraps=orchestrator.todo_builder.create_todo,
+        ) as create_todo:
+            assert orchestrator.create_todo(data) == "ABC"
+            assert orchestrator.create_todo(dict(data)) == "ABC"
+
+        create_todo.assert_called_once()
+        first, second = orchestrator.engine.execute.call_args_list
+        assert first == second
+
+    def test_payloads_differing_in_type_are_not_shared(
+        self, orchestrator: Things3Orchestrator
+    ) -> None:
+        """Test that equal values of different types get their own scripts."""
+        orchestrator.update_todo("ABC", {"name": "1"})
+        orchestrator.update_todo("ABC", {"name": 1})
+
+        first, second = orchestrator.engine.execute.call_args_list
+        assert 'to "1"' in first.args[0]
+        assert "to 1" in second.args[0]
+
+
+class TestThings3OrchestratorCompiledCreate:
+    """Test creation of plain todos through the compiled script."""
+
+    @pytest.fixture
+    def orchestrator(self) -> Things3Orchestrator:
+        orchestrator = Things3Orchestrator()
+        orchestrator.engine = Mock()
+        orchestrator.engine.execute_compiled.return_value = "ABC"
+        return orchestrator
+
+    def test_plain_todo_passes_values_as_arguments(
+        self, orchestrator: Things3Orchestrator
+    ) -> None:
+        """Test that name, notes and tags go to the compiled script as argv."""
+        result = orchestrator.create_todo({"name": 'Say "hi"', "tags": ["a", "b"]})
+
+        assert result == "ABC"
+        orchestrator.engine.execute.assert_not_called()
+        call = orchestrator.engine.execute_compiled.call_args
+        assert call.args[0] == "create_todo"
+        assert "on run argv" in call.args[1]
+        assert call.kwargs["args"] == ['Say "hi"', "", "a, b"]
+        assert call.kwargs["flags"] is None
+
+    def test_script_is_the_same_for_every_todo(
+        self, orchestrator: Things3Orchestrator
+    ) -> None:
+        """Test that different todos reuse one script source."""
+        orchestrator.create_todo({"name": "One"})
+        orchestrator.create_todo({"name": "Two", "notes": "More"})
+
+        first, second = orchestrator.engine.execute_compiled.call_args_list
+        assert first.args[1] == second.args[1]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"name": "Later", "when": "someday"},
+            {"name": "Due", "due_date": "2025-06-20"},
+            {"name": "Untitled", "notes": None},
+        ],
+    )
+    def test_other_todos_are_built_per_call(
+        self, orchestrator: Things3Orchestrator, data: dict
+    ) -> None:
+        """Test that todos needing more than argv use the built script."""
+        orchestrator.engine.execute.return_value = "ABC"
+
+        assert orchestrator.create_todo(data) == "ABC"
+        orchestrator.engine.execute_compiled.assert_not_called()
+
+
+class TestThings3OrchestratorBatch:
+    """Test creation of several todos in one batch."""
+
+    def test_partial_failure_keeps_created_ids(self) -> None:
+        """Test that IDs of todos created before a failure are not lost."""
+        orchestrator = Things3Orchestrator()
+        orchestrator.engine = Mock()
+        orchestrator.engine.execute_batch.side_effect = AppleScriptBatchError(
+            "AppleScript batch script 1 failed", "", -1728, results=["ABC", None]
+        )
+
+        with pytest.raises(AppleScriptBatchError) as exc_info:
+            orchestrator.create_todos([{"name": "One"}, {"name": "Two"}])
+
+        assert exc_info.value.results == ["ABC", None]
+
+
+class TestThings3OrchestratorPropertiesBatch:
+    """Test reading the properties of several objects in one run."""
+
+    @pytest.fixture
+    def orchestrator(self) -> Things3Orchestrator:
+        orchestrator = Things3Orchestrator()
+        orchestrator.engine = Mock()
+
+        def execute_structured(script: str) -> str:
+            # Like AppleScript, one missing object fails the whole list
+            if 'to do id "todo-404"' in script:
+                raise AppleScriptExecutionError(
+                    "AppleScript execution failed",
+                    'Things3 got an error: Can’t get to do id "todo-404". (-1728)',
+                    1,
+                    script,
+                )
+            records = []
+            if 'project id "project-123"' in script:
+                records.append('{id:"project-123", name:"Project"}')
+            if 'area id "area-123"' in script:
+                records.append('{id:"area-123", name:"Area"}')
+            return "{" + ", ".join(records) + "}"
+
+        orchestrator.engine.execute_structured.side_effect = execute_structured
+        return orchestrator
+
+    def test_single_run(self, orchestrator: Things3Orchestrator) -> None:
+        """Test that readable objects are fetched in one run."""
+        result = orchestrator.get_properties_batch(
+            ['project id "project-123"', 'area id "area-123"']
+        )
+
+        assert [props["id"] for props in result] == ["project-123", "area-123"]
+        orchestrator.engine.execute_structured.assert_called_once()
+
+    def test_missing_object_is_left_out(
+        self, orchestrator: Things3Orchestrator
+    ) -> None:
+        """Test that a missing object doesn't fail the other reads."""
+        result = orchestrator.get_properties_batch(
+            ['to do id "todo-404"', 'project id "project-123"', 'area id "area-123"']
+        )
+
+        assert [props["id"] for props in result] == ["project-123", "area-123"]
+        assert orchestrator.engine.execute_structured.call_count == 4
+
+    def test_other_errors_are_raised(
+        self, orchestrator: Things3Orchestrator
+    ) -> None:
+        """Test that failures other than a missing object still raise."""
+        orchestrator.engine.execute_structured.side_effect = AppleScriptExecutionError(
+            "AppleScript execution failed", "Things3 isn't running", 1
+        )
+
+        with pytest.raises(AppleScriptExecutionError):
+            orchestrator.get_properties_batch(
+                ['project id "project-123"', 'area id "area-123"']
+            )
@@ -6,6 +6,7 @@ specific AppleScript commands using the generic builder infrastructure.
 """
 
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from applescript.builders import AppleScriptCommand, CommandBuilder
@@ -15,6 +16,22 @@ from applescript.converters import (
 )
 
 
+@lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> Optional[Union[date, datetime]]:
+    """
+    Parse an ISO date or date-time string, once per distinct string.
+
+    Strings that are not ISO dates return None, which is cached too, so a
+    repeated bad value doesn't raise and catch an exception every time.
+    """
+    try:
+        if "T" in value or " " in value:
+            return datetime.fromisoformat(value)
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 class Things3CommandBuilder(CommandBuilder):
     """Base class for Things 3 command builders."""
 
@@ -22,6 +39,9 @@ class Things3CommandBuilder(CommandBuilder):
         self.converter = PythonToAppleScriptConverter()
         self.ref_converter = AppleScriptReferenceConverter()
 
+    # Things 3 date keywords, passed through as they are
+    DATE_KEYWORDS = frozenset({"today", "tomorrow", "evening", "anytime", "someday"})
+
     def _format_date(self, date_value: Union[date, datetime, str]) -> Optional[str]:
         """Format a date for Things 3."""
         if not date_value:
@@ -29,14 +49,15 @@ class Things3CommandBuilder(CommandBuilder):
 
         if isinstance(date_value, str):
             # Handle special Things 3 date keywords
-            if date_value.lower() in [
-                "today",
-                "tomorrow",
-                "evening",
-                "anytime",
-                "someday",
-            ]:
-                return date_value.lower()
+            keyword = date_value.lower()
+            if keyword in self.DATE_KEYWORDS:
+                return keyword
+
+            # Other strings are ISO dates, e.g. "2025-06-20"
+            parsed = _parse_iso_date(date_value)
+            if parsed is None:
+                raise ValueError(f"Invalid date: {date_value!r}")
+            date_value = parsed
 
         # Use converter for date objects - this already returns unquoted expressions
         return self.converter._format_date(date_value)
@@ -55,34 +76,39 @@ class Things3CommandBuilder(CommandBuilder):
                 return ref
 
         # Check if it's an ID reference without proper quotes
-        if ref.startswith(f"{ref_type} id "):
+        id_prefix = f"{ref_type} id "
+        if ref.startswith(id_prefix):
             # Extract the ID part
-            id_part = ref[len(f"{ref_type} id "):]
+            id_part = ref[len(id_prefix) :]
             # Ensure the ID is properly quoted
             if not (id_part.startswith('"') and id_part.endswith('"')):
                 return f'{ref_type} id "{id_part}"'
             else:
                 return ref
 
-        # Otherwise, treat as name reference
-        return f'{ref_type} "{ref}"'
+        # Otherwise, treat as name reference; names may contain quotes
+        return f"{ref_type} {self.converter._quote_string(ref)}"
 
     def _build_properties_record(self, properties: Dict[str, Any]) -> str:
         """Build an AppleScript record from properties."""
-        if not properties:
-            return "{}"
-
-        items = []
-        for key, value in properties.items():
-            value_str = self.converter.convert(value)
-            items.append(f"{key}:{value_str}")
-
-        return "{" + ", ".join(items) + "}"
+        # A dict converts to a record, with all values in one conversion pass
+        return self.converter.convert(properties)
 
 
 class TodoCommandBuilder(Things3CommandBuilder):
     """Builder for Things 3 todo-related commands."""
 
+    # Lists a todo moves to for each "when" value (besides "tomorrow")
+    WHEN_LISTS = {
+        "today": 'list "Today"',
+        "upcoming": 'list "Upcoming"',
+        "anytime": 'list "Anytime"',
+        "someday": 'list "Someday"',
+    }
+
+    # Properties that create_todo_from_argv can set
+    ARGV_FIELDS = frozenset({"name", "notes", "tags"})
+
     def create_todo(self, data: Dict[str, Any]) -> AppleScriptCommand:
         """
         Build command to create a new todo.
@@ -124,6 +150,53 @@ class TodoCommandBuilder(Things3CommandBuilder):
 
         return cmd
 
+    def create_todo_from_argv(self) -> AppleScriptCommand:
+        """
+        Build a command that creates a todo from its run arguments.
+
+        The script reads the name, notes and comma-separated tag names
+        from argv, so it can be compiled once and reused for every todo
+        that create_todo_args accepts.
+
+        Returns:
+            AppleScriptCommand ready to compile
+        """
+        return (
+            AppleScriptCommand()
+            .tell("Things3")
+            .add_command(
+                "set newTodo to make new to do with properties "
+                "{name:item 1 of argv, notes:item 2 of argv, tag names:item 3 of argv}"
+            )
+            .return_value("id of newTodo")
+            .with_argv()
+        )
+
+    def create_todo_args(self, data: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Get the run arguments of create_todo_from_argv for a todo.
+
+        Args:
+            data: Todo properties
+
+        Returns:
+            The name, notes and tag names, or None if the todo needs
+            anything else (dates, project, checklist, ...) and must be
+            built with create_todo instead
+        """
+        if not self.ARGV_FIELDS.issuperset(data):
+            return None
+
+        name = data.get("name", "")
+        notes = data.get("notes", "")
+        tags = data.get("tags") or []
+        if not isinstance(name, str) or not isinstance(notes, str):
+            return None
+        if not all(isinstance(tag, str) for tag in tags):
+            return None
+
+        return [name, notes, ", ".join(tags)]
+
     def update_todo(self, todo_id: str, data: Dict[str, Any]) -> AppleScriptCommand:
         """
         Build command to update an existing todo.
@@ -232,29 +305,34 @@ class TodoCommandBuilder(Things3CommandBuilder):
         if when_lower == "tomorrow":
             cmd.move(todo_ref, to='list "Today"')
             cmd.set("due date", of=todo_ref, to="(current date) + (1 * days)")
-        elif when_lower in ["today", "upcoming", "anytime", "someday"]:
-            list_name = when_lower.capitalize()
-            cmd.move(todo_ref, to=f'list "{list_name}"')
+        elif when_lower in self.WHEN_LISTS:
+            cmd.move(todo_ref, to=self.WHEN_LISTS[when_lower])
 
     def _add_checklist_commands(
         self, cmd: AppleScriptCommand, todo_ref: str, checklist: List[Union[str, Dict]]
     ) -> None:
         """Add commands to create checklist items."""
-        for item in checklist:
-            if isinstance(item, dict) and "name" in item:
-                item_name = item["name"]
-            else:
-                item_name = str(item)
+        names = [
+            item["name"] if isinstance(item, dict) and "name" in item else str(item)
+            for item in checklist
+        ]
 
-            cmd.add_command(
-                f"tell {todo_ref} to make new checklist item "
-                f"with properties {{name:{self.converter.convert(item_name)}}}"
-            )
+        # Only the item name differs between the commands
+        prefix = f"tell {todo_ref} to make new checklist item with properties {{name:"
+        convert = self.converter.convert
+        for name in names:
+            cmd.add_command(f"{prefix}{convert(name)}}}")
 
 
 class ProjectCommandBuilder(Things3CommandBuilder):
     """Builder for Things 3 project-related commands."""
 
+    # Lists a project moves to for each "when" value
+    WHEN_LISTS = {
+        "anytime": 'list "Anytime"',
+        "someday": 'list "Someday"',
+    }
+
     def create_project(self, data: Dict[str, Any]) -> AppleScriptCommand:
         """Build command to create a new project."""
         cmd = AppleScriptCommand().tell("Things3")
@@ -360,10 +438,9 @@ class ProjectCommandBuilder(Things3CommandBuilder):
         # Projects can be scheduled similar to todos
         when_lower = when.lower()
 
-        if when_lower in ["anytime", "someday"]:
+        if when_lower in self.WHEN_LISTS:
             # Move to appropriate list
-            list_name = when_lower.capitalize()
-            cmd.move(project_ref, to=f'list "{list_name}"')
+            cmd.move(project_ref, to=self.WHEN_LISTS[when_lower])
 
 
 class AreaCommandBuilder(Things3CommandBuilder):
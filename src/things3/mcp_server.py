@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """MCP Server for Things 3."""
 
+import asyncio
 import signal
 import sys
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from fastmcp import FastMCP
@@ -14,8 +16,11 @@ from things3.models import TodoCreate, TodoUpdate, ProjectCreate, ProjectUpdate
 # Create the MCP server
 mcp = FastMCP(name="things3-mcp")
 
-# Create Things3 API instance
-api = Things3API()
+# Create Things3 API instance; the server is long-running, so scripts go
+# through one persistent osascript process instead of one process each.
+# API calls block on osascript, so tools run them in worker threads and
+# the event loop stays free to serve other requests meanwhile
+api = Things3API(persistent=True)
 
 
 # Todo operations
@@ -27,7 +32,7 @@ async def get_todo(
 
     Returns the todo if found, or None if the todo doesn't exist.
     """
-    todo = api.get_todo(todo_id)
+    todo = await asyncio.to_thread(api.get_todo, todo_id)
     return todo.model_dump() if todo else None
 
 
@@ -37,7 +42,7 @@ async def get_all_todos() -> List[Dict[str, Any]]:
 
     Returns a list of all todos in the system.
     """
-    todos = api.get_all_todos()
+    todos = await asyncio.to_thread(api.get_all_todos)
     return [todo.model_dump() for todo in todos]
 
 
@@ -51,7 +56,7 @@ async def get_todos_by_list(
 
     Valid list names are: Inbox, Today, Upcoming, Anytime, Someday, Logbook
     """
-    todos = api.get_todos_by_list(list_name)
+    todos = await asyncio.to_thread(api.get_todos_by_list, list_name)
     return [todo.model_dump() for todo in todos]
 
 
@@ -60,7 +65,7 @@ async def get_todos_by_project(
     project_id: str = Field(description="The ID of the project"),
 ) -> List[Dict[str, Any]]:
     """Get todos belonging to a specific project."""
-    todos = api.get_todos_by_project(project_id)
+    todos = await asyncio.to_thread(api.get_todos_by_project, project_id)
     return [todo.model_dump() for todo in todos]
 
 
@@ -69,7 +74,7 @@ async def get_todos_by_area(
     area_id: str = Field(description="The ID of the area"),
 ) -> List[Dict[str, Any]]:
     """Get todos belonging to a specific area."""
-    todos = api.get_todos_by_area(area_id)
+    todos = await asyncio.to_thread(api.get_todos_by_area, area_id)
     return [todo.model_dump() for todo in todos]
 
 
@@ -78,7 +83,7 @@ async def get_todos_by_tag(
     tag_name: str = Field(description="Name of the tag"),
 ) -> List[Dict[str, Any]]:
     """Get todos with a specific tag."""
-    todos = api.get_todos_by_tag(tag_name)
+    todos = await asyncio.to_thread(api.get_todos_by_tag, tag_name)
     return [todo.model_dump() for todo in todos]
 
 
@@ -116,8 +121,6 @@ async def create_todo(
     Creates a new todo with the specified properties and returns the created todo.
     """
     # Convert date strings to date objects if provided
-    from datetime import datetime
-
     parsed_due_date = None
     parsed_deadline = None
     parsed_start_date = None
@@ -147,7 +150,7 @@ async def create_todo(
     )
 
     # Create the todo
-    created_todo = api.create_todo(todo_data)
+    created_todo = await asyncio.to_thread(api.create_todo, todo_data)
     return created_todo.model_dump()
 
 
@@ -186,8 +189,6 @@ async def update_todo(
     Only provided fields will be updated; others remain unchanged.
     """
     # Convert date strings to date objects if provided
-    from datetime import datetime
-
     parsed_due_date = None
 
     if due_date is not None:
@@ -226,7 +227,7 @@ async def update_todo(
     update_data = TodoUpdate(**update_fields)
 
     # Update the todo
-    updated_todo = api.update_todo(todo_id, update_data)
+    updated_todo = await asyncio.to_thread(api.update_todo, todo_id, update_data)
     return updated_todo.model_dump()
 
 
@@ -239,7 +240,7 @@ async def get_project(
 
     Returns the project if found, or None if the project doesn't exist.
     """
-    project = api.get_project(project_id)
+    project = await asyncio.to_thread(api.get_project, project_id)
     return project.model_dump() if project else None
 
 
@@ -249,7 +250,7 @@ async def get_all_projects() -> List[Dict[str, Any]]:
 
     Returns a list of all projects in the system.
     """
-    projects = api.get_all_projects()
+    projects = await asyncio.to_thread(api.get_all_projects)
     return [project.model_dump() for project in projects]
 
 
@@ -258,7 +259,7 @@ async def get_projects_by_area(
     area_id: str = Field(description="The ID of the area"),
 ) -> List[Dict[str, Any]]:
     """Get projects belonging to a specific area."""
-    projects = api.get_projects_by_area(area_id)
+    projects = await asyncio.to_thread(api.get_projects_by_area, area_id)
     return [project.model_dump() for project in projects]
 
 
@@ -287,8 +288,6 @@ async def create_project(
     Creates a new project with the specified properties and returns the created project.
     """
     # Convert date strings to date objects if provided
-    from datetime import datetime
-
     parsed_deadline = None
 
     if deadline:
@@ -308,7 +307,7 @@ async def create_project(
     )
 
     # Create the project
-    created_project = api.create_project(project_data)
+    created_project = await asyncio.to_thread(api.create_project, project_data)
     return created_project.model_dump()
 
 
@@ -344,8 +343,6 @@ async def update_project(
     Only provided fields will be updated; others remain unchanged.
     """
     # Convert date strings to date objects if provided
-    from datetime import datetime
-
     parsed_deadline = None
 
     if deadline is not None:
@@ -378,7 +375,9 @@ async def update_project(
     update_data = ProjectUpdate(**update_fields)
 
     # Update the project
-    updated_project = api.update_project(project_id, update_data)
+    updated_project = await asyncio.to_thread(
+        api.update_project, project_id, update_data
+    )
     return updated_project.model_dump()
 
 
@@ -391,7 +390,7 @@ async def get_area(
 
     Returns the area if found, or None if the area doesn't exist.
     """
-    area = api.get_area(area_id)
+    area = await asyncio.to_thread(api.get_area, area_id)
     return area.model_dump() if area else None
 
 
@@ -401,7 +400,7 @@ async def get_all_areas() -> List[Dict[str, Any]]:
 
     Returns a list of all areas in the system.
     """
-    areas = api.get_all_areas()
+    areas = await asyncio.to_thread(api.get_all_areas)
     return [area.model_dump() for area in areas]
 
 
@@ -414,7 +413,7 @@ async def get_tag(
 
     Returns the tag if found, or None if the tag doesn't exist.
     """
-    tag = api.get_tag(tag_id)
+    tag = await asyncio.to_thread(api.get_tag, tag_id)
     return tag.model_dump() if tag else None
 
 
@@ -424,7 +423,7 @@ async def get_all_tags() -> List[Dict[str, Any]]:
 
     Returns a list of all tags in the system.
     """
-    tags = api.get_all_tags()
+    tags = await asyncio.to_thread(api.get_all_tags)
     return [tag.model_dump() for tag in tags]
 
 
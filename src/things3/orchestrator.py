@@ -7,7 +7,11 @@ parsers and converters.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Union
 
 from applescript.core import AppleScriptEngine
 from applescript.parsers import (
@@ -21,7 +25,11 @@ from applescript.converters import (
     PropertyConverter,
 )
 from applescript.builders import AppleScriptCommand
-from applescript.errors import AppleScriptError
+from applescript.errors import (
+    AppleScriptBatchError,
+    AppleScriptError,
+    AppleScriptExecutionError,
+)
 
 from things3.parsers import Things3RecordParser, Things3PropertyNormalizer
 from things3.command_builders import (
@@ -34,6 +42,25 @@ from things3.command_builders import (
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Hashable:
+    """
+    Build a hashable key that identifies a command payload value.
+
+    Each level carries the value's type, so values that compare equal but
+    convert differently (True and 1, a list and a tuple) get different keys.
+
+    Raises:
+        TypeError: If the value contains something unhashable
+    """
+    if isinstance(value, dict):
+        items = tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+        return (dict, items)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
 class Things3Orchestrator:
     """
     Orchestrator for Things 3 AppleScript operations.
@@ -42,10 +69,29 @@ class Things3Orchestrator:
     Things 3 using the modular AppleScript infrastructure.
     """
 
-    def __init__(self):
-        """Initialize the Things 3 orchestrator."""
+    # Any of these marks a script as a write operation; one search of the
+    # script covers them all
+    WRITE_PATTERN = re.compile(r"make new|set |delete |move |create |update ")
+
+    # AppleScript error number for a reference to an object that doesn't
+    # exist, found in the error output or return code
+    NO_SUCH_OBJECT_ERROR = "-1728"
+
+    # Built todo scripts kept for payloads that recur, e.g. during a sync
+    SCRIPT_CACHE_SIZE = 512
+
+    def __init__(self, persistent: bool = False):
+        """
+        Initialize the Things 3 orchestrator.
+
+        Args:
+            persistent: Run scripts in one long-lived osascript process
+                instead of spawning osascript for every command
+        """
         self.app_name = "Things3"
-        self.engine = AppleScriptEngine()
+        self._tell_prefix = f'tell application "{self.app_name}"\n    '
+        self._tell_suffix = "\nend tell"
+        self.engine = AppleScriptEngine(persistent=persistent)
         self.converter = PythonToAppleScriptConverter()
         self.property_converter = PropertyConverter()
 
@@ -68,6 +114,9 @@ class Things3Orchestrator:
         self.area_builder = AreaCommandBuilder()
         self.tag_builder = TagCommandBuilder()
 
+        self._scripts: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._scripts_lock = threading.Lock()
+
     def execute_command(
         self, command: Union[str, AppleScriptCommand], return_raw: bool = False
     ) -> Any:
@@ -84,15 +133,7 @@ class Things3Orchestrator:
         Raises:
             AppleScriptError: If execution fails
         """
-        # Build the script
-        if isinstance(command, AppleScriptCommand):
-            script = command.build()
-        else:
-            # Legacy string command - wrap in tell block if needed
-            if not command.startswith("tell application"):
-                script = f'tell application "{self.app_name}"\n    {command}\nend tell'
-            else:
-                script = command
+        script = self._build_script(command)
 
         # Determine if we should use structured output
         # Always use structured output for read operations, regardless of return_raw
@@ -119,18 +160,141 @@ class Things3Orchestrator:
             logger.error(f"Unexpected error executing command: {e}")
             raise AppleScriptError(f"Failed to execute command: {e}")
 
+    def execute_batch(
+        self, commands: Sequence[Union[str, AppleScriptCommand]]
+    ) -> List[Any]:
+        """
+        Execute several write commands in a single AppleScript run.
+
+        Each command's result is returned as text, so this is meant for
+        commands returning IDs or nothing (create, update, move, delete)
+        rather than reads returning records.
+
+        Args:
+            commands: String commands or AppleScriptCommand instances
+
+        Returns:
+            Parsed result of each command, in the same order as the commands
+
+        Raises:
+            AppleScriptBatchError: If any command fails. The other commands
+                still ran; their parsed results are in the error's results,
+                with None for each command that failed
+            AppleScriptError: If execution of the batch fails
+        """
+        scripts = [self._build_script(command) for command in commands]
+
+        try:
+            raw_outputs = self.engine.execute_batch(scripts)
+
+            logger.debug(f"Raw batch output: {raw_outputs}")
+
+            return [self.parser_chain.parse(output) for output in raw_outputs]
+
+        except AppleScriptBatchError as e:
+            e.results = [
+                None if output is None else self.parser_chain.parse(output)
+                for output in e.results
+            ]
+            raise
+        except AppleScriptError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error executing batch: {e}")
+            raise AppleScriptError(f"Failed to execute batch: {e}")
+
+    def _build_script(self, command: Union[str, AppleScriptCommand]) -> str:
+        """Build the script for a command, wrapping legacy strings in a tell block."""
+        if isinstance(command, AppleScriptCommand):
+            return command.build()
+
+        # Legacy string command - wrap in tell block if needed
+        if not command.startswith("tell application"):
+            return self._tell_prefix + command + self._tell_suffix
+
+        return command
+
+    def _cached_script(self, payload: Any, build: Callable[[], str]) -> str:
+        """
+        Return the script built for a payload, building it on first use.
+
+        Relative dates in a script depend on the current day, so the day is
+        part of the key. Payloads that can't be hashed are always built.
+
+        Args:
+            payload: Everything the built script depends on
+            build: Builds the script when it is not cached
+
+        Returns:
+            AppleScript source
+        """
+        try:
+            key = (date.today(), _freeze(payload))
+        except TypeError:
+            return build()
+
+        with self._scripts_lock:
+            script = self._scripts.get(key)
+            if script is not None:
+                self._scripts.move_to_end(key)
+                return script
+
+        script = build()
+
+        with self._scripts_lock:
+            self._scripts[key] = script
+            while len(self._scripts) > self.SCRIPT_CACHE_SIZE:
+                self._scripts.popitem(last=False)
+
+        return script
+
+    def execute_compiled_command(
+        self,
+        name: str,
+        command: AppleScriptCommand,
+        args: Optional[List[str]] = None,
+        structured: bool = True,
+    ) -> Any:
+        """
+        Execute a read command through the compiled script cache.
+
+        The command should be built with ``with_argv()`` and read its
+        per-call values from ``argv`` so one compiled script serves
+        every call.
+
+        Args:
+            name: Short name for the script, used in the cache file name
+            command: AppleScriptCommand to compile and execute
+            args: Arguments passed to the script's run handler
+            structured: Request structured output; write commands that
+                return a plain value (e.g. an ID) should pass False
+
+        Returns:
+            Parsed result
+
+        Raises:
+            AppleScriptError: If compilation or execution fails
+        """
+        script = command.build()
+
+        try:
+            raw_output = self.engine.execute_compiled(
+                name, script, args=args, flags=["-s", "s"] if structured else None
+            )
+
+            logger.debug(f"Raw output: {raw_output}")
+
+            return self.parser_chain.parse(raw_output)
+
+        except AppleScriptError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error executing command: {e}")
+            raise AppleScriptError(f"Failed to execute command: {e}")
+
     def _is_write_command(self, script: str) -> bool:
         """Check if a script is a write operation."""
-        write_indicators = [
-            "make new",
-            "set ",
-            "delete ",
-            "move ",
-            "create ",
-            "update ",
-        ]
-
-        return any(indicator in script for indicator in write_indicators)
+        return self.WRITE_PATTERN.search(script) is not None
 
     # Todo operations
     def create_todo(self, data: Dict[str, Any]) -> str:
@@ -143,8 +307,46 @@ class Things3Orchestrator:
         Returns:
             ID of the created todo
         """
-        command = self.todo_builder.create_todo(data)
-        return self.execute_command(command)
+        # Plain todos share one compiled script and only pass their values
+        args = self.todo_builder.create_todo_args(data)
+        if args is not None:
+            command = self.todo_builder.create_todo_from_argv()
+            return self.execute_compiled_command(
+                "create_todo", command, args, structured=False
+            )
+
+        script = self._cached_script(
+            ("create_todo", None, data),
+            lambda: self.todo_builder.create_todo(data).build(),
+        )
+        return self.execute_command(script)
+
+    def create_todos(self, data_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several todos in a single AppleScript run.
+
+        Prefer this over calling create_todo in a loop, which starts one
+        osascript process per todo.
+
+        Args:
+            data_list: Properties of each todo
+
+        Returns:
+            IDs of the created todos, in the same order as data_list
+
+        Raises:
+            AppleScriptBatchError: If any todo could not be created. The
+                others are still created; the error's results hold their
+                IDs, with None for each todo that failed
+        """
+        scripts = [
+            self._cached_script(
+                ("create_todo", None, data),
+                lambda: self.todo_builder.create_todo(data).build(),
+            )
+            for data in data_list
+        ]
+        return self.execute_batch(scripts)
 
     def update_todo(self, todo_id: str, data: Dict[str, Any]) -> str:
         """
@@ -157,8 +359,11 @@ class Things3Orchestrator:
         Returns:
             ID of the updated todo
         """
-        command = self.todo_builder.update_todo(todo_id, data)
-        return self.execute_command(command)
+        script = self._cached_script(
+            ("update_todo", todo_id, data),
+            lambda: self.todo_builder.update_todo(todo_id, data).build(),
+        )
+        return self.execute_command(script)
 
     def delete_todo(self, todo_id: str) -> str:
         """
@@ -186,10 +391,11 @@ class Things3Orchestrator:
         command = (
             AppleScriptCommand()
             .tell(self.app_name)
-            .get("properties", of=f'to do id "{todo_id}"')
+            .get("properties", of="to do id (item 1 of argv)")
+            .with_argv()
         )
 
-        result = self.execute_command(command)
+        result = self.execute_compiled_command("get_todo", command, [todo_id])
 
         # Normalize the properties
         if isinstance(result, dict):
@@ -211,7 +417,11 @@ class Things3Orchestrator:
             command = (
                 AppleScriptCommand()
                 .tell(self.app_name)
-                .get("properties", of=f'every to do of list "{list_name}"')
+                .get("properties", of="every to do of list (item 1 of argv)")
+                .with_argv()
+            )
+            result = self.execute_compiled_command(
+                "list_todos_by_list", command, [list_name]
             )
         else:
             command = (
@@ -219,8 +429,7 @@ class Things3Orchestrator:
                 .tell(self.app_name)
                 .get("properties", of="every to do")
             )
-
-        result = self.execute_command(command)
+            result = self.execute_compiled_command("list_todos", command)
 
         # Normalize each todo
         if isinstance(result, list):
@@ -232,6 +441,52 @@ class Things3Orchestrator:
 
         return result if isinstance(result, list) else []
 
+    # Batch operations
+    def get_properties_batch(self, references: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get the properties of several objects in a single AppleScript run.
+
+        Args:
+            references: Object references (e.g. 'to do id "ABC"', 'project id "XYZ"')
+
+        Returns:
+            List of raw property dictionaries, in the same order as the
+            given references. Objects that don't exist are left out
+
+        Raises:
+            AppleScriptError: If the AppleScript execution fails
+        """
+        if not references:
+            return []
+
+        items = ", ".join(f"properties of {ref}" for ref in references)
+        command = AppleScriptCommand().tell(self.app_name).get(f"{{{items}}}")
+
+        try:
+            result = self.execute_command(command)
+        except AppleScriptExecutionError as e:
+            if len(references) == 1:
+                if self.NO_SUCH_OBJECT_ERROR in str(e):
+                    return []
+                raise
+
+            # One missing object fails the whole list, so read each on its own
+            logger.debug(f"Batched properties read failed, retrying individually: {e}")
+            return [
+                props
+                for reference in references
+                for props in self.get_properties_batch([reference])
+            ]
+
+        # A single-element list comes back as a bare record
+        if isinstance(result, dict):
+            result = [result]
+
+        if not isinstance(result, list):
+            return []
+
+        return [props for props in result if isinstance(props, dict)]
+
     # Project operations
     def create_project(self, data: Dict[str, Any]) -> str:
         """Create a new project."""
@@ -248,10 +503,11 @@ class Things3Orchestrator:
         command = (
             AppleScriptCommand()
             .tell(self.app_name)
-            .get("properties", of=f'project id "{project_id}"')
+            .get("properties", of="project id (item 1 of argv)")
+            .with_argv()
         )
 
-        result = self.execute_command(command)
+        result = self.execute_compiled_command("get_project", command, [project_id])
 
         if isinstance(result, dict):
             return self.normalizer.normalize_properties(result)
@@ -266,7 +522,7 @@ class Things3Orchestrator:
             .get("properties", of="every project")
         )
 
-        result = self.execute_command(command)
+        result = self.execute_compiled_command("list_projects", command)
 
         if isinstance(result, list):
             return [
@@ -293,10 +549,11 @@ class Things3Orchestrator:
         command = (
             AppleScriptCommand()
             .tell(self.app_name)
-            .get("properties", of=f'area id "{area_id}"')
+            .get("properties", of="area id (item 1 of argv)")
+            .with_argv()
         )
 
-        result = self.execute_command(command)
+        result = self.execute_compiled_command("get_area", command, [area_id])
 
         if isinstance(result, dict):
             return self.normalizer.normalize_properties(result)
@@ -309,7 +566,7 @@ class Things3Orchestrator:
             AppleScriptCommand().tell(self.app_name).get("properties", of="every area")
         )
 
-        result = self.execute_command(command)
+        result = self.execute_compiled_command("list_areas", command)
 
         if isinstance(result, list):
             return [
@@ -330,7 +587,7 @@ class Things3Orchestrator:
         """List all tag names."""
         command = AppleScriptCommand().tell(self.app_name).get("name", of="every tag")
 
-        result = self.execute_command(command)
+        result = self.execute_compiled_command("list_tags", command)
 
         return result if isinstance(result, list) else []
 
@@ -19,6 +19,17 @@ class Things3RecordParser(StructuredRecordParser):
     Things 3 specific object references and data types.
     """
 
+    # Object references as printed by Things 3
+    REFERENCE_PATTERN = re.compile(
+        r'(?:project id|area id|to do id|tag|list) ".*" of application "Things3"\Z'
+    )
+
+    # First characters of the references above
+    REFERENCE_CHARS = frozenset("patl")
+
+    # Simplified reference: ('type', 'identifier')
+    SIMPLIFIED_PATTERN = re.compile(r'(\w+)(?:\s+id)?\s+"([^"]+)"\Z')
+
     def _parse_value(self, value_str: str) -> Any:
         """
         Parse a structured value string with Things 3 specific handling.
@@ -29,7 +40,9 @@ class Things3RecordParser(StructuredRecordParser):
         value_str = value_str.strip()
 
         # Handle Things 3 object references
-        if self._is_things3_reference(value_str):
+        if value_str[:1] in self.REFERENCE_CHARS and self._is_things3_reference(
+            value_str
+        ):
             return self._parse_things3_reference(value_str)
 
         # Fall back to base parser
@@ -37,19 +50,7 @@ class Things3RecordParser(StructuredRecordParser):
 
     def _is_things3_reference(self, value_str: str) -> bool:
         """Check if a value is a Things 3 object reference."""
-        reference_patterns = [
-            r'^project id ".*" of application "Things3"$',
-            r'^area id ".*" of application "Things3"$',
-            r'^to do id ".*" of application "Things3"$',
-            r'^tag ".*" of application "Things3"$',
-            r'^list ".*" of application "Things3"$',
-        ]
-
-        for pattern in reference_patterns:
-            if re.match(pattern, value_str):
-                return True
-
-        return False
+        return self.REFERENCE_PATTERN.match(value_str) is not None
 
     def _parse_things3_reference(self, value_str: str) -> str:
         """
@@ -64,7 +65,7 @@ class Things3RecordParser(StructuredRecordParser):
         simplified = value_str.split(" of application ")[0]
 
         # Extract the ID or name from quotes
-        match = re.match(r'^(\w+)(?:\s+id)?\s+"([^"]+)"$', simplified)
+        match = self.SIMPLIFIED_PATTERN.match(simplified)
         if match:
             obj_type = match.group(1)
             identifier = match.group(2)
@@ -85,6 +86,9 @@ class Things3DateParser:
     Things 3 uses various date representations that need special handling.
     """
 
+    # Standard date format: "Friday, June 20, 2025 at 20:24:30"
+    DATE_PATTERN = re.compile(r"\w+, \w+ \d+, \d+ at \d+:\d+:\d+\Z")
+
     def parse_date_expression(self, expr: str) -> Optional[str]:
         """
         Parse Things 3 date expressions.
@@ -110,7 +114,7 @@ class Things3DateParser:
             return relative_dates[expr.lower()]
 
         # Standard date format
-        if re.match(r"^\w+, \w+ \d+, \d+ at \d+:\d+:\d+$", expr):
+        if self.DATE_PATTERN.match(expr):
             return expr
 
         return expr
@@ -4,34 +4,50 @@ Show today's todos in a pretty format using Rich.
 
 This script fetches all todos from the "Today" list in Things 3
 and displays them in a beautiful, formatted table.
+
+Run it with ``uv run show-today``.
 """
 
-import sys
-from pathlib import Path
+import logging
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, List, Optional
 from datetime import date
 
-# Add the src directory to the path so we can import our modules
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
 from rich import box
 
+from applescript.errors import AppleScriptError
 from things3.things3_api import Things3API
 from things3.models import Todo
 
+logger = logging.getLogger(__name__)
+
+# Table columns as (header, style, width)
+_COLUMNS = (
+    ("Todo", "white", 35),
+    ("Due Date", "cyan", 12),
+    ("Project", "green", 18),
+    ("Area", "magenta", 18),
+    ("Tags", "blue", 15),
+    ("Status", "yellow", 10),
+)
+
+# Status display with emoji
+_STATUS_DISPLAY = {
+    "open": "📝 Open",
+    "completed": "✅ Done",
+    "canceled": "❌ Canceled"
+}
+
 
-def format_due_date(due_date: Optional[date]) -> str:
+def format_due_date(due_date: Optional[date], today: date) -> str:
     """Format due date for display."""
     if not due_date:
         return "[dim]No due date[/dim]"
     
-    today = datetime.now().date()
     if due_date == today:
         return "[bold red]Today[/bold red]"
     elif due_date < today:
@@ -44,22 +60,22 @@ def format_tags(tags: Optional[List[str]]) -> str:
     """Format tags for display."""
     if not tags:
         return ""
-    return " ".join([f"[blue]#{tag}[/blue]" for tag in tags])
+    return " ".join(f"[blue]#{tag}[/blue]" for tag in tags)
 
 
+@lru_cache(maxsize=1024)
 def extract_id_from_reference(reference: Optional[str]) -> Optional[str]:
     """Extract ID from Things 3 reference string."""
     if not reference:
         return None
     
     # References are in format "project id ABC123" or "area id XYZ789"
-    if " id " in reference:
-        return reference.split(" id ")[1]
-    return None
+    _, sep, ref_id = reference.partition(" id ")
+    return ref_id if sep else None
 
 
-def get_project_name(api: Things3API, project_ref: Optional[str], project_cache: Dict[str, str]) -> str:
-    """Get project name from reference, with caching."""
+def get_project_name(project_ref: Optional[str], project_cache: Dict[str, str]) -> str:
+    """Get project name from reference using the prefetched cache."""
     if not project_ref:
         return "[dim]No project[/dim]"
     
@@ -67,26 +83,11 @@ def get_project_name(api: Things3API, project_ref: Optional[str], project_cache:
     if not project_id:
         return f"[green]{project_ref}[/green]"
     
-    # Check cache first
-    if project_id in project_cache:
-        return project_cache[project_id]
-    
-    # Fetch from API
-    try:
-        project = api.get_project(project_id)
-        if project:
-            result = f"[green]{project.name}[/green]"
-        else:
-            result = f"[green]{project_id}[/green]"
-    except Exception:
-        result = f"[green]{project_id}[/green]"
-    
-    project_cache[project_id] = result
-    return result
+    return project_cache.get(project_id, f"[green]{project_id}[/green]")
 
 
-def get_area_name(api: Things3API, area_ref: Optional[str], area_cache: Dict[str, str]) -> str:
-    """Get area name from reference, with caching."""
+def get_area_name(area_ref: Optional[str], area_cache: Dict[str, str]) -> str:
+    """Get area name from reference using the prefetched cache."""
     if not area_ref:
         return "[dim]No area[/dim]"
     
@@ -94,22 +95,7 @@ def get_area_name(api: Things3API, area_ref: Optional[str], area_cache: Dict[str
     if not area_id:
         return f"[magenta]{area_ref}[/magenta]"
     
-    # Check cache first
-    if area_id in area_cache:
-        return area_cache[area_id]
-    
-    # Fetch from API
-    try:
-        area = api.get_area(area_id)
-        if area:
-            result = f"[magenta]{area.name}[/magenta]"
-        else:
-            result = f"[magenta]{area_id}[/magenta]"
-    except Exception:
-        result = f"[magenta]{area_id}[/magenta]"
-    
-    area_cache[area_id] = result
-    return result
+    return area_cache.get(area_id, f"[magenta]{area_id}[/magenta]")
 
 
 def main() -> None:
@@ -129,10 +115,27 @@ def main() -> None:
         ))
         return
     
-    # Create caches for projects and areas to avoid repeated API calls
+    # Collect the distinct project and area IDs up front
+    project_ids = {extract_id_from_reference(todo.project) for todo in todos}
+    area_ids = {extract_id_from_reference(todo.area) for todo in todos}
+    project_ids.discard(None)
+    area_ids.discard(None)
+
+    # Fetch every referenced project and area in a single AppleScript run
     project_cache: Dict[str, str] = {}
     area_cache: Dict[str, str] = {}
-    
+    try:
+        prefetched = api.prefetch(
+            project_ids=sorted(project_ids), area_ids=sorted(area_ids)
+        )
+        for project_id, project in prefetched["projects"].items():
+            project_cache[project_id] = f"[green]{project.name}[/green]"
+        for area_id, area in prefetched["areas"].items():
+            area_cache[area_id] = f"[magenta]{area.name}[/magenta]"
+    except AppleScriptError as e:
+        # Unresolved references are shown by ID
+        logger.warning(f"Failed to resolve project and area names: {e}")
+
     # Create a table for the todos
     table = Table(
         title=f"Today's Todos ({len(todos)} items)",
@@ -141,14 +144,12 @@ def main() -> None:
         header_style="bold magenta"
     )
     
-    table.add_column("Todo", style="white", width=35)
-    table.add_column("Due Date", style="cyan", width=12)
-    table.add_column("Project", style="green", width=18)
-    table.add_column("Area", style="magenta", width=18)
-    table.add_column("Tags", style="blue", width=15)
-    table.add_column("Status", style="yellow", width=10)
+    for header, style, width in _COLUMNS:
+        table.add_column(header, style=style, width=width)
     
     # Add todos to the table
+    today = datetime.now().date()
+    status_display_for = _STATUS_DISPLAY.get
     for todo in todos:
         # Format the todo name with notes if available
         todo_name = todo.name
@@ -156,17 +157,15 @@ def main() -> None:
             todo_name += f"\n[dim]{todo.notes[:50]}{'...' if len(todo.notes) > 50 else ''}[/dim]"
         
         # Format status with emoji
-        status_display = {
-            "open": "📝 Open",
-            "completed": "✅ Done",
-            "canceled": "❌ Canceled"
-        }.get(todo.status.value if todo.status else "open", "📝 Open")
+        status_display = status_display_for(
+            todo.status.value if todo.status else "open", "📝 Open"
+        )
         
         table.add_row(
             todo_name,
-            format_due_date(todo.due_date),
-            get_project_name(api, todo.project, project_cache),
-            get_area_name(api, todo.area, area_cache),
+            format_due_date(todo.due_date, today),
+            get_project_name(todo.project, project_cache),
+            get_area_name(todo.area, area_cache),
             format_tags(todo.tags),
             status_display
         )
@@ -7,8 +7,12 @@ via the AppleScript orchestrator.
 """
 
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from dateutil import parser as date_parser
 
 from things3.orchestrator import Things3Orchestrator
@@ -28,6 +32,99 @@ from things3.models import (
 logger = logging.getLogger(__name__)
 
 
+class _BatchingDispatcher:
+    """
+    Coalesce single-object lookups into batched AppleScript runs.
+
+    Lookups submitted within the batch window of each other are collected
+    by a background thread and fetched together with one call to
+    ``fetch_batch``. Each caller gets a Future for its own result.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[Tuple[str, str]]], Dict[Tuple[str, str], Any]],
+        window: float = 0.05,
+        max_batch: int = 64,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            fetch_batch: Callable fetching a list of (kind, id) keys and
+                returning a dictionary of results by key
+            window: Seconds to wait for more lookups after the first one
+            max_batch: Number of lookups that triggers an immediate flush
+        """
+        self._fetch_batch = fetch_batch
+        self._window = window
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Tuple[str, str, Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, object_id: str) -> Future:
+        """
+        Queue a lookup.
+
+        Args:
+            kind: Type of object ("todo", "project" or "area")
+            object_id: ID of the object
+
+        Returns:
+            Future resolving to the parsed object, or None if it was not found
+        """
+        future: Future = Future()
+        self._queue.put((kind, object_id, future))
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="things3-batcher", daemon=True
+                )
+                self._thread.start()
+
+        return future
+
+    def _run(self) -> None:
+        """Collect queued lookups into batches and flush them."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._window
+
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[str, str, Future]]) -> None:
+        """Fetch a batch of lookups and resolve their futures."""
+        keys = list(dict.fromkeys((kind, object_id) for kind, object_id, _ in batch))
+
+        try:
+            results = self._fetch_batch(keys)
+        except Exception as e:
+            if len(keys) == 1:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                return
+
+            # One missing object fails the whole run, so retry one by one
+            logger.debug(f"Batched lookup failed, retrying individually: {e}")
+            for kind, object_id, future in batch:
+                self._flush([(kind, object_id, future)])
+            return
+
+        for kind, object_id, future in batch:
+            future.set_result(results.get((kind, object_id)))
+
+
 class Things3API:
     """
     Read-only API for interacting with Things 3.
@@ -36,9 +133,25 @@ class Things3API:
     like todos, projects, areas, and tags.
     """
 
-    def __init__(self):
-        """Initialize the Things 3 API."""
-        self.orchestrator = Things3Orchestrator()
+    def __init__(
+        self, batch_window: Optional[float] = None, persistent: bool = False
+    ):
+        """
+        Initialize the Things 3 API.
+
+        Args:
+            batch_window: If set, get_todo, get_project and get_area calls
+                made within this many seconds of each other (e.g. from
+                several threads) are fetched in a single AppleScript run
+            persistent: Run scripts in one long-lived osascript process,
+                which suits long-running callers like the MCP server
+        """
+        self.orchestrator = Things3Orchestrator(persistent=persistent)
+        self._dispatcher = (
+            _BatchingDispatcher(self._fetch_batch, window=batch_window)
+            if batch_window is not None
+            else None
+        )
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """
@@ -92,6 +205,35 @@ class Things3API:
         }
         return mapping.get(class_value)
 
+    def _get_properties_command(self, collection: str, limit: Optional[int]) -> str:
+        """
+        Build a command getting the properties of a collection.
+
+        Args:
+            collection: Plural AppleScript class name (e.g. "to dos")
+            limit: Optional maximum number of items to get
+
+        Returns:
+            AppleScript command string
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit is None:
+            return f"get properties of {collection}"
+
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+
+        # Ranges past the end of the collection are an error in AppleScript
+        return (
+            f"if (count of {collection}) > {limit} then\n"
+            f"    get properties of {collection} 1 thru {limit}\n"
+            f"else\n"
+            f"    get properties of {collection}\n"
+            f"end if"
+        )
+
     def _parse_todo(self, props: Dict[str, Any]) -> Todo:
         """
         Parse AppleScript properties into a Todo object.
@@ -211,6 +353,9 @@ class Things3API:
             AppleScriptError: If the AppleScript execution fails
         """
         try:
+            if self._dispatcher is not None:
+                return self._dispatcher.submit("todo", todo_id).result()
+
             command = f'get properties of to do id "{todo_id}"'
             props = self.orchestrator.execute_command(command)
             if not props:
@@ -221,17 +366,21 @@ class Things3API:
                 return None
             raise
 
-    def get_all_todos(self) -> List[Todo]:
+    def get_all_todos(self, limit: Optional[int] = None) -> List[Todo]:
         """
         Get all todos.
 
+        Args:
+            limit: Optional maximum number of todos to return
+
         Returns:
             List of all todos
 
         Raises:
+            ValueError: If limit is less than 1
             AppleScriptError: If the AppleScript execution fails
         """
-        command = "get properties of to dos"
+        command = self._get_properties_command("to dos", limit)
         props_list = self.orchestrator.execute_command(command)
 
         if not isinstance(props_list, list):
@@ -335,6 +484,9 @@ class Things3API:
             AppleScriptError: If the AppleScript execution fails
         """
         try:
+            if self._dispatcher is not None:
+                return self._dispatcher.submit("project", project_id).result()
+
             command = f'get properties of project id "{project_id}"'
             props = self.orchestrator.execute_command(command)
             if not props:
@@ -345,17 +497,21 @@ class Things3API:
                 return None
             raise
 
-    def get_all_projects(self) -> List[Project]:
+    def get_all_projects(self, limit: Optional[int] = None) -> List[Project]:
         """
         Get all projects.
 
+        Args:
+            limit: Optional maximum number of projects to return
+
         Returns:
             List of all projects
 
         Raises:
+            ValueError: If limit is less than 1
             AppleScriptError: If the AppleScript execution fails
         """
-        command = "get properties of projects"
+        command = self._get_properties_command("projects", limit)
         props_list = self.orchestrator.execute_command(command)
 
         if not isinstance(props_list, list):
@@ -398,6 +554,9 @@ class Things3API:
             AppleScriptError: If the AppleScript execution fails
         """
         try:
+            if self._dispatcher is not None:
+                return self._dispatcher.submit("area", area_id).result()
+
             command = f'get properties of area id "{area_id}"'
             props = self.orchestrator.execute_command(command)
             if not props:
@@ -408,17 +567,21 @@ class Things3API:
                 return None
             raise
 
-    def get_all_areas(self) -> List[Area]:
+    def get_all_areas(self, limit: Optional[int] = None) -> List[Area]:
         """
         Get all areas.
 
+        Args:
+            limit: Optional maximum number of areas to return
+
         Returns:
             List of all areas
 
         Raises:
+            ValueError: If limit is less than 1
             AppleScriptError: If the AppleScript execution fails
         """
-        command = "get properties of areas"
+        command = self._get_properties_command("areas", limit)
         props_list = self.orchestrator.execute_command(command)
 
         if not isinstance(props_list, list):
@@ -470,6 +633,123 @@ class Things3API:
 
         return [self._parse_tag(props) for props in props_list]
 
+    # Bulk read operations
+
+    def prefetch(
+        self,
+        todo_ids: Optional[List[str]] = None,
+        project_ids: Optional[List[str]] = None,
+        area_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch todos, projects and areas by ID in a single AppleScript run.
+
+        Args:
+            todo_ids: IDs of the todos to fetch
+            project_ids: IDs of the projects to fetch
+            area_ids: IDs of the areas to fetch
+
+        Returns:
+            Dictionary with "todos", "projects" and "areas" keys, each
+            mapping IDs to the parsed Todo, Project or Area objects. IDs
+            whose object doesn't exist are missing from it
+
+        Raises:
+            AppleScriptError: If the AppleScript execution fails
+        """
+        # Deduplicate while preserving order
+        todo_ids = list(dict.fromkeys(todo_ids or []))
+        project_ids = list(dict.fromkeys(project_ids or []))
+        area_ids = list(dict.fromkeys(area_ids or []))
+
+        references = (
+            [f'to do id "{todo_id}"' for todo_id in todo_ids]
+            + [f'project id "{project_id}"' for project_id in project_ids]
+            + [f'area id "{area_id}"' for area_id in area_ids]
+        )
+        props_list = self.orchestrator.get_properties_batch(references)
+
+        # Records are matched to the requested IDs by their id property, not
+        # their position, as objects that don't exist are left out
+        by_id = {props.get("id"): props for props in props_list}
+
+        return {
+            "todos": {
+                todo_id: self._parse_todo(by_id[todo_id])
+                for todo_id in todo_ids
+                if todo_id in by_id
+            },
+            "projects": {
+                project_id: self._parse_project(by_id[project_id])
+                for project_id in project_ids
+                if project_id in by_id
+            },
+            "areas": {
+                area_id: self._parse_area(by_id[area_id])
+                for area_id in area_ids
+                if area_id in by_id
+            },
+        }
+
+    def _fetch_batch(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Any]:
+        """
+        Fetch a batch of (kind, id) lookups for the dispatcher.
+
+        Args:
+            keys: List of (kind, id) tuples, kind being "todo", "project" or "area"
+
+        Returns:
+            Dictionary mapping (kind, id) tuples to parsed objects
+        """
+        ids: Dict[str, List[str]] = {"todo": [], "project": [], "area": []}
+        for kind, object_id in keys:
+            ids[kind].append(object_id)
+
+        prefetched = self.prefetch(
+            todo_ids=ids["todo"], project_ids=ids["project"], area_ids=ids["area"]
+        )
+
+        results: Dict[Tuple[str, str], Any] = {}
+        for kind, group in (
+            ("todo", "todos"),
+            ("project", "projects"),
+            ("area", "areas"),
+        ):
+            for object_id, obj in prefetched[group].items():
+                results[(kind, object_id)] = obj
+
+        return results
+
+    def get_projects_by_ids(self, project_ids: List[str]) -> Dict[str, Project]:
+        """
+        Get several projects by ID in a single AppleScript run.
+
+        Args:
+            project_ids: The IDs of the projects
+
+        Returns:
+            Dictionary mapping project IDs to Project objects
+
+        Raises:
+            AppleScriptError: If the AppleScript execution fails
+        """
+        return self.prefetch(project_ids=project_ids)["projects"]
+
+    def get_areas_by_ids(self, area_ids: List[str]) -> Dict[str, Area]:
+        """
+        Get several areas by ID in a single AppleScript run.
+
+        Args:
+            area_ids: The IDs of the areas
+
+        Returns:
+            Dictionary mapping area IDs to Area objects
+
+        Raises:
+            AppleScriptError: If the AppleScript execution fails
+        """
+        return self.prefetch(area_ids=area_ids)["areas"]
+
     def create_todo(self, todo_data: TodoCreate) -> Todo:
         """
         Create a new todo in Things 3.
@@ -483,14 +763,8 @@ class Things3API:
         Raises:
             AppleScriptError: If the AppleScript execution fails
         """
-        # Extract data from the TodoCreate object
-        if hasattr(todo_data, "model_dump"):
-            data = todo_data.model_dump(exclude_none=True)
-        else:
-            data = dict(todo_data)
-
         # Create the todo using the orchestrator
-        todo_id = self.orchestrator.create_todo(data)
+        todo_id = self.orchestrator.create_todo(self._creation_data(todo_data))
 
         if not todo_id:
             raise AppleScriptError("Failed to create todo - no ID returned")
@@ -504,6 +778,62 @@ class Things3API:
 
         return created_todo
 
+    def create_todos(self, todos_data: List[TodoCreate]) -> List[Todo]:
+        """
+        Create several todos in Things 3.
+
+        All todos are created in one AppleScript run and read back in
+        another, however many there are.
+
+        Args:
+            todos_data: TodoCreate objects with the properties of each todo
+
+        Returns:
+            The created Todo objects, in the same order as todos_data
+
+        Raises:
+            AppleScriptBatchError: If any todo could not be created. The
+                other todos are still created and left in Things 3; the
+                error's results hold their IDs, with None for each failure
+            AppleScriptError: If the AppleScript execution fails
+        """
+        if not todos_data:
+            return []
+
+        todo_ids = self.orchestrator.create_todos(
+            [self._creation_data(todo_data) for todo_data in todos_data]
+        )
+
+        if not all(todo_ids):
+            raise AppleScriptError("Failed to create todos - no ID returned")
+
+        created = self.prefetch(todo_ids=todo_ids)["todos"]
+        missing = [todo_id for todo_id in todo_ids if todo_id not in created]
+        if missing:
+            raise AppleScriptError(
+                f"Failed to retrieve created todos with IDs: {', '.join(missing)}"
+            )
+
+        return [created[todo_id] for todo_id in todo_ids]
+
+    def _creation_data(self, model: Any) -> Dict[str, Any]:
+        """Extract the properties to create an object with from a *Create model."""
+        if hasattr(model, "model_dump"):
+            return model.model_dump(exclude_none=True)
+        return dict(model)
+
+    def _update_data(self, model: Any) -> Dict[str, Any]:
+        """
+        Extract the properties to update from an *Update model.
+
+        Only explicitly set fields are included, with None meaning the
+        property is cleared. Every *Update field defaults to None, so the
+        set fields are read directly rather than dumping the whole model.
+        """
+        if hasattr(model, "model_fields_set"):
+            return {name: getattr(model, name) for name in model.model_fields_set}
+        return dict(model)
+
     def update_todo(self, todo_id: str, update_data: TodoUpdate) -> Todo:
         """
         Update an existing todo in Things 3.
@@ -519,18 +849,7 @@ class Things3API:
             AppleScriptError: If the AppleScript execution fails
         """
         # Extract data from the TodoUpdate object
-        if hasattr(update_data, "model_dump"):
-            # For updates, preserve None values that were explicitly set
-            all_data = update_data.model_dump(exclude_none=False)
-            # Only include fields that were explicitly set
-            data = {
-                k: v
-                for k, v in all_data.items()
-                if getattr(update_data, k) is not None
-                or k in update_data.model_fields_set
-            }
-        else:
-            data = dict(update_data)
+        data = self._update_data(update_data)
 
         # Update the todo using the orchestrator
         result_id = self.orchestrator.update_todo(todo_id, data)
@@ -562,14 +881,8 @@ class Things3API:
         Raises:
             AppleScriptError: If the AppleScript execution fails
         """
-        # Extract data from the ProjectCreate object
-        if hasattr(project_data, "model_dump"):
-            data = project_data.model_dump(exclude_none=True)
-        else:
-            data = dict(project_data)
-
         # Create the project using the orchestrator
-        project_id = self.orchestrator.create_project(data)
+        project_id = self.orchestrator.create_project(self._creation_data(project_data))
 
         if not project_id:
             raise AppleScriptError("Failed to create project - no ID returned")
@@ -598,18 +911,7 @@ class Things3API:
             AppleScriptError: If the AppleScript execution fails
         """
         # Extract data from the ProjectUpdate object
-        if hasattr(update_data, "model_dump"):
-            # For updates, preserve None values that were explicitly set
-            all_data = update_data.model_dump(exclude_none=False)
-            # Only include fields that were explicitly set
-            data = {
-                k: v
-                for k, v in all_data.items()
-                if getattr(update_data, k) is not None
-                or k in update_data.model_fields_set
-            }
-        else:
-            data = dict(update_data)
+        data = self._update_data(update_data)
 
         # Update the project using the orchestrator
         result_id = self.orchestrator.update_project(project_id, data)